@@ -20,6 +20,9 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 # Enable contracts for this demo
 os.environ["GOVERNANCE_CONTRACTS_ENABLED"] = "1"
 
+# Steps buffered between Prometheus registry updates
+METRICS_BATCH_SIZE = 16
+
 
 def demo_basic_governance():
     """Demo 1: Basic governance kernel with metrics."""
@@ -35,11 +38,15 @@ def demo_basic_governance():
     registry = PrometheusRegistry()
     
     print("\nRunning 10 steps with varying signals...")
+    pending = []
     for i in range(10):
         # Simulate decreasing rewards (agent struggling)
         reward = max(0.0, 0.5 - i * 0.05)
         result = kernel.step(reward=reward, novelty=0.05, urgency=0.1)
-        registry.record_step(result)
+        pending.append(result)
+        if len(pending) >= METRICS_BATCH_SIZE:
+            registry.record_batch(pending)
+            pending.clear()
         
         status = "[HALTED]" if result.halted else "[OK]"
         print(f"  Step {i+1}: {status} | effort={result.budget.effort:.3f} | reward={reward:.2f}")
@@ -47,6 +54,7 @@ def demo_basic_governance():
         if result.halted:
             print(f"  -> Halt reason: {result.reason}")
             break
+    registry.record_batch(pending)
     
     print(f"\n[METRICS] Summary:")
     print(f"   Total steps: {registry.steps_total.get()}")
@@ -84,6 +92,8 @@ def demo_hash_chained_audit():
         )
         print(f"  Entry {i+1}: hash={entry.entry_hash[:16]}...")
     
+    audit.close()
+    
     # Verify the chain
     print("\n[VERIFY] Checking chain integrity...")
     is_valid, error = HashChainedAuditLogger.verify_chain(audit_file)
@@ -231,6 +231,7 @@ def run_trial(
             )
 
     # --- Audit chain verification ---
+    audit.close()
     audit_valid, _ = HashChainedAuditLogger.verify_chain(audit_path)
     if not audit_valid:
         violations.append("Audit chain verification failed")
@@ -17,7 +17,7 @@ import os
 import sys
 import tempfile
 from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 # Add src to path for local runs.
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
@@ -27,8 +27,19 @@ from governance.kernel import GovernanceKernel
 from governance.metrics import PrometheusRegistry
 from governance.profiles import BALANCED
 
+# Steps buffered between Prometheus registry updates
+METRICS_BATCH_SIZE = 16
 
-@dataclass
+# Milestone bits for the investigation state
+SEEN_SPIKE = 1
+LOGS = 2
+DEPLOY = 4
+QUERY = 8
+FIX = 16
+SUMMARY = 32
+
+
+@dataclass(frozen=True, slots=True)
 class ActionResult:
     success: bool
     novelty: float
@@ -37,49 +48,58 @@ class ActionResult:
     notes: str
 
 
-def simulate_tool(action: str, memory: Dict[str, bool]) -> ActionResult:
+# Tool outcomes are constant per (action, outcome); built once and shared,
+# which is safe because ActionResult is frozen.
+_ACTION_RESULTS: Dict[str, ActionResult] = {
+    "check_error_dashboard": ActionResult(True, novelty=0.7, reward=0.4, urgency=0.6, notes="Found spike"),
+    "pull_recent_logs_ok": ActionResult(True, novelty=0.6, reward=0.35, urgency=0.6, notes="Logs show timeout"),
+    "pull_recent_logs_fail": ActionResult(False, novelty=0.1, reward=0.0, urgency=0.5, notes="No context"),
+    "inspect_deploy": ActionResult(True, novelty=0.5, reward=0.3, urgency=0.4, notes="Recent deploy detected"),
+    "run_query_ok": ActionResult(True, novelty=0.4, reward=0.25, urgency=0.5, notes="Slow query found"),
+    "run_query_fail": ActionResult(False, novelty=0.0, reward=0.0, urgency=0.6, notes="Missing logs"),
+    "propose_fix_ok": ActionResult(True, novelty=0.2, reward=0.6, urgency=0.4, notes="Fix drafted"),
+    "propose_fix_fail": ActionResult(False, novelty=0.0, reward=0.0, urgency=0.7, notes="Insufficient evidence"),
+    "postmortem_summary_ok": ActionResult(True, novelty=0.1, reward=0.5, urgency=0.3, notes="Summary complete"),
+    "postmortem_summary_fail": ActionResult(False, novelty=0.0, reward=0.0, urgency=0.6, notes="No fix"),
+    "unknown": ActionResult(False, novelty=0.0, reward=0.0, urgency=0.5, notes="Unknown action"),
+}
+
+# action -> (milestones required, success key, failure key, milestone set on success)
+_DISPATCH: Dict[str, Tuple[int, str, str, int]] = {
+    "check_error_dashboard": (0, "check_error_dashboard", "check_error_dashboard", SEEN_SPIKE),
+    "pull_recent_logs": (SEEN_SPIKE, "pull_recent_logs_ok", "pull_recent_logs_fail", LOGS),
+    "inspect_deploy": (0, "inspect_deploy", "inspect_deploy", DEPLOY),
+    "run_query": (LOGS, "run_query_ok", "run_query_fail", QUERY),
+    "propose_fix": (QUERY, "propose_fix_ok", "propose_fix_fail", FIX),
+    "postmortem_summary": (FIX, "postmortem_summary_ok", "postmortem_summary_fail", SUMMARY),
+}
+
+# Deterministic plan order: first action whose milestone is not yet set
+_PLAN: Tuple[Tuple[str, int], ...] = (
+    ("check_error_dashboard", SEEN_SPIKE),
+    ("pull_recent_logs", LOGS),
+    ("inspect_deploy", DEPLOY),
+    ("run_query", QUERY),
+    ("propose_fix", FIX),
+)
+
+
+def simulate_tool(action: str, state: int) -> Tuple[int, ActionResult]:
     """Return deterministic tool outcomes to mimic real-world constraints."""
-    if action == "check_error_dashboard":
-        memory["seen_error_spike"] = True
-        return ActionResult(True, novelty=0.7, reward=0.4, urgency=0.6, notes="Found spike")
-    if action == "pull_recent_logs":
-        if not memory.get("seen_error_spike"):
-            return ActionResult(False, novelty=0.1, reward=0.0, urgency=0.5, notes="No context")
-        memory["logs_pulled"] = True
-        return ActionResult(True, novelty=0.6, reward=0.35, urgency=0.6, notes="Logs show timeout")
-    if action == "inspect_deploy":
-        memory["deploy_checked"] = True
-        return ActionResult(True, novelty=0.5, reward=0.3, urgency=0.4, notes="Recent deploy detected")
-    if action == "run_query":
-        if not memory.get("logs_pulled"):
-            return ActionResult(False, novelty=0.0, reward=0.0, urgency=0.6, notes="Missing logs")
-        memory["query_run"] = True
-        return ActionResult(True, novelty=0.4, reward=0.25, urgency=0.5, notes="Slow query found")
-    if action == "propose_fix":
-        if not memory.get("query_run"):
-            return ActionResult(False, novelty=0.0, reward=0.0, urgency=0.7, notes="Insufficient evidence")
-        memory["fix_proposed"] = True
-        return ActionResult(True, novelty=0.2, reward=0.6, urgency=0.4, notes="Fix drafted")
-    if action == "postmortem_summary":
-        if not memory.get("fix_proposed"):
-            return ActionResult(False, novelty=0.0, reward=0.0, urgency=0.6, notes="No fix")
-        memory["summary_done"] = True
-        return ActionResult(True, novelty=0.1, reward=0.5, urgency=0.3, notes="Summary complete")
-    return ActionResult(False, novelty=0.0, reward=0.0, urgency=0.5, notes="Unknown action")
-
-
-def planner(state: Dict[str, bool]) -> str:
+    entry = _DISPATCH.get(action)
+    if entry is None:
+        return state, _ACTION_RESULTS["unknown"]
+    required, ok_key, fail_key, sets = entry
+    if state & required != required:
+        return state, _ACTION_RESULTS[fail_key]
+    return state | sets, _ACTION_RESULTS[ok_key]
+
+
+def planner(state: int) -> str:
     """Deterministic plan: mimics a typical incident investigation."""
-    if not state.get("seen_error_spike"):
-        return "check_error_dashboard"
-    if not state.get("logs_pulled"):
-        return "pull_recent_logs"
-    if not state.get("deploy_checked"):
-        return "inspect_deploy"
-    if not state.get("query_run"):
-        return "run_query"
-    if not state.get("fix_proposed"):
-        return "propose_fix"
+    for action, mask in _PLAN:
+        if not state & mask:
+            return action
     return "postmortem_summary"
 
 
@@ -94,20 +114,26 @@ def run_simulation(max_steps: int = 12) -> Tuple[List[str], str]:
     with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
         audit_path = f.name
 
-    audit = HashChainedAuditLogger(filepath=audit_path)
-    memory: Dict[str, bool] = {}
-    transcript: List[str] = []
+    audit = HashChainedAuditLogger(filepath=audit_path, background=True)
+    state = 0
+    pending_metrics = []
+    # Raw per-step rows, formatted once after the loop
+    rows: List[Optional[Tuple[int, str, bool, float, bool]]] = [None] * max_steps
+    outcome = None
 
     for step in range(1, max_steps + 1):
-        action = planner(memory)
-        tool_result = simulate_tool(action, memory)
+        action = planner(state)
+        state, tool_result = simulate_tool(action, state)
 
         decision = kernel.step(
             reward=tool_result.reward,
             novelty=tool_result.novelty,
             urgency=tool_result.urgency,
         )
-        registry.record_step(decision)
+        pending_metrics.append(decision)
+        if len(pending_metrics) >= METRICS_BATCH_SIZE:
+            registry.record_batch(pending_metrics)
+            pending_metrics.clear()
 
         audit.log(
             step=step,
@@ -121,19 +147,28 @@ def run_simulation(max_steps: int = 12) -> Tuple[List[str], str]:
             result=decision,
         )
 
-        transcript.append(
-            f"Step {step}: action={action} | success={tool_result.success} | "
-            f"effort={decision.budget.effort:.3f} | halted={decision.halted}"
+        rows[step - 1] = (
+            step, action, tool_result.success, decision.budget.effort, decision.halted
         )
 
         if decision.halted:
-            transcript.append(f"HALT REASON: {decision.reason}")
+            outcome = f"HALT REASON: {decision.reason}"
             break
 
-        if memory.get("summary_done"):
-            transcript.append("TASK COMPLETE: postmortem summary generated.")
+        if state & SUMMARY:
+            outcome = "TASK COMPLETE: postmortem summary generated."
             break
 
+    transcript = [
+        "Step %d: action=%s | success=%s | effort=%.3f | halted=%s" % row
+        for row in rows
+        if row is not None
+    ]
+    if outcome is not None:
+        transcript.append(outcome)
+
+    registry.record_batch(pending_metrics)
+    audit.close()
     is_valid, error = HashChainedAuditLogger.verify_chain(audit_path)
     audit_status = "PASS" if is_valid else f"FAIL ({error})"
     os.unlink(audit_path)
@@ -16,7 +16,9 @@ USAGE:
     python integrations/openai_sdk_ollama.py
 """
 
+import re
 import sys
+from collections import deque
 
 try:
     from openai import OpenAI
@@ -34,6 +36,11 @@ from governance import GovernanceAgent, step, Signals
 OLLAMA_MODEL = "gemma3:1b"
 OLLAMA_BASE_URL = "http://localhost:11434/v1"
 MAX_ITERATIONS = 15
+HISTORY_TURNS = 4  # assistant/user turn pairs kept after the pinned prompt
+
+# Signal extraction patterns, compiled once
+_PROGRESS_RE = re.compile(r"[1-5]")
+_COMPLETE_RE = re.compile(r"5")
 
 # ============================================================
 # Governance Engine-Governed OpenAI SDK Loop
@@ -70,25 +77,43 @@ def run_governed_loop():
     print("-" * 60)
     
     # 3. Agentic loop with governance
-    messages = [
+    # System prompt and task stay pinned; only the last HISTORY_TURNS turns
+    # are resent, so request size stays bounded as the loop runs.
+    pinned = [
         {"role": "system", "content": "You are a helpful assistant. Answer concisely."},
         {"role": "user", "content": "Count from 1 to 5, one number per response."}
     ]
+    window = deque(maxlen=2 * HISTORY_TURNS)
     
     previous_response = ""
     
     for iteration in range(MAX_ITERATIONS):
         print(f"\n[Step {iteration + 1}]")
         
-        # Call LLM
+        # Call LLM (streamed, so completion can be detected mid-response)
         try:
-            response = client.chat.completions.create(
+            stream = client.chat.completions.create(
                 model=OLLAMA_MODEL,
-                messages=messages,
-                max_tokens=50
+                messages=[*pinned, *window],
+                max_tokens=50,
+                stream=True
             )
-            content = response.choices[0].message.content
-            finish_reason = response.choices[0].finish_reason
+            parts = []
+            finish_reason = None
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                choice = chunk.choices[0]
+                delta = choice.delta.content
+                if delta:
+                    parts.append(delta)
+                if choice.finish_reason:
+                    finish_reason = choice.finish_reason
+                if delta and _COMPLETE_RE.search(delta):
+                    # Task is complete; stop generating
+                    stream.close()
+                    break
+            content = "".join(parts)
             print(f"LLM: {content}")
         except Exception as e:
             print(f"Error: {e}")
@@ -96,9 +121,9 @@ def run_governed_loop():
             finish_reason = "error"
         
         # Extract signals
-        is_complete = "5" in content or finish_reason == "stop"
+        is_complete = bool(_COMPLETE_RE.search(content)) or finish_reason == "stop"
         is_repetitive = content == previous_response
-        made_progress = any(str(i) in content for i in range(1, 6))
+        made_progress = bool(_PROGRESS_RE.search(content))
         
         signals = Signals(
             reward=0.8 if made_progress else 0.1,
@@ -122,8 +147,8 @@ def run_governed_loop():
             break
         
         # Continue conversation
-        messages.append({"role": "assistant", "content": content})
-        messages.append({"role": "user", "content": "Continue"})
+        window.append({"role": "assistant", "content": content})
+        window.append({"role": "user", "content": "Continue"})
         previous_response = content
     
     print("\nDemo complete.")
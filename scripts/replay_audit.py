@@ -19,81 +19,245 @@ import json
 import hashlib
 import sys
 import os
+import re
+from collections import Counter
+from functools import lru_cache
 from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Built once: json.dumps() with non-default options constructs a new
+# encoder on every call. Output matches governance.audit byte for byte.
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, separators=(',', ':'))
+_canonical_encode = _CANONICAL_ENCODER.encode
+# OpenSSL-backed constructor (SHA-NI where the CPU has it)
+_sha256 = hashlib.sha256
+
 
 def canonical_json(obj: Dict[str, Any]) -> str:
     """Create deterministic JSON for hash computation."""
-    return json.dumps(obj, sort_keys=True, separators=(',', ':'))
+    return _canonical_encode(obj)
+
+
+_MISSING = object()
 
 
 def compute_entry_hash(entry_dict: Dict[str, Any]) -> str:
-    """Compute SHA256 hash of an audit entry."""
-    hashable = {k: v for k, v in entry_dict.items() if k != "entry_hash"}
-    canonical = canonical_json(hashable)
-    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+    """
+    Compute SHA256 hash of an audit entry.
+    
+    entry_hash is popped for the encode and put back afterwards rather
+    than copying every other field into a new dict.
+    """
+    saved = entry_dict.pop("entry_hash", _MISSING)
+    try:
+        canonical = _canonical_encode(entry_dict)
+    finally:
+        if saved is not _MISSING:
+            entry_dict["entry_hash"] = saved
+    return _sha256(canonical.encode('utf-8')).hexdigest()
 
 
-def load_audit_file(filepath: str) -> Tuple[List[Dict], Optional[str]]:
+def _loads(line: bytes) -> Any:
+    """Parse one JSON line from bytes, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            pass  # NaN, big ints etc.; the stdlib decides if it is valid
+    return json.loads(line)
+
+
+def read_audit_entries(
+    filepath: str,
+    offset: int = 0,
+    first_line: int = 1,
+) -> Tuple[List[Dict], int, int, Optional[str]]:
     """
-    Load audit entries from JSONL file.
+    Read audit entries from a JSONL file, starting at a byte offset.
+    
+    Lines are read as bytes and parsed without a separate decode pass.
+    
+    Args:
+        filepath: Path to audit chain JSONL file
+        offset: Byte offset of the first line to read
+        first_line: Line number of that line, for error messages
     
     Returns:
-        Tuple of (entries list, error message or None)
+        Tuple of (entries list, end byte offset, last line number,
+        error message or None)
     """
     if not os.path.exists(filepath):
-        return [], f"File not found: {filepath}"
+        return [], offset, first_line - 1, f"File not found: {filepath}"
     
     entries = []
+    end = offset
+    line_num = first_line - 1
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            for line_num, line in enumerate(f, 1):
+        with open(filepath, 'rb') as f:
+            f.seek(offset)
+            for line_num, line in enumerate(f, first_line):
+                end += len(line)
                 line = line.strip()
                 if not line:
                     continue
                 try:
-                    entry = json.loads(line)
+                    entry = _loads(line)
                     entries.append(entry)
                 except json.JSONDecodeError as e:
-                    return [], f"Invalid JSON at line {line_num}: {e}"
+                    return [], offset, line_num, f"Invalid JSON at line {line_num}: {e}"
     except Exception as e:
-        return [], f"Failed to read file: {e}"
+        return [], offset, line_num, f"Failed to read file: {e}"
     
-    return entries, None
+    return entries, end, line_num, None
 
 
-def verify_chain(entries: List[Dict]) -> Tuple[bool, Optional[str]]:
+def load_audit_file(filepath: str) -> Tuple[List[Dict], Optional[str]]:
+    """
+    Load audit entries from JSONL file.
+    
+    Returns:
+        Tuple of (entries list, error message or None)
+    """
+    entries, _, _, error = read_audit_entries(filepath)
+    return entries, error
+
+
+def verify_chain(
+    entries: List[Dict],
+    prev_hash: str = "",
+    start: int = 0,
+) -> Tuple[bool, Optional[str]]:
     """
     Verify the hash chain integrity.
     
+    Args:
+        entries: Entries to check, in file order
+        prev_hash: entry_hash of the entry before entries[0] ("" at the start
+            of the chain)
+        start: Number of entries before entries[0], for error messages
+    
     Returns:
         Tuple of (is_valid, error message or None)
     """
     if not entries:
         return True, None
     
-    prev_hash = ""
-    
-    for i, entry in enumerate(entries):
+    for i, entry in enumerate(entries, start + 1):
         # Check previous_hash linkage
         if entry.get("previous_hash", "") != prev_hash:
-            return False, f"Chain broken at entry {i+1}: previous_hash mismatch"
+            return False, f"Chain broken at entry {i}: previous_hash mismatch"
         
         # Verify entry_hash
         expected_hash = compute_entry_hash(entry)
         actual_hash = entry.get("entry_hash", "")
         
         if expected_hash != actual_hash:
-            return False, f"Hash mismatch at entry {i+1}: expected {expected_hash[:16]}..., got {actual_hash[:16]}..."
+            return False, f"Hash mismatch at entry {i}: expected {expected_hash[:16]}..., got {actual_hash[:16]}..."
         
         prev_hash = actual_hash
     
     return True, None
 
 
+def _verified_state_path(filepath: str) -> str:
+    return filepath + ".verified.json"
+
+
+def _prefix_digest(filepath: str, size: int) -> str:
+    """SHA256 of the first size bytes of the file."""
+    h = _sha256()
+    with open(filepath, 'rb') as f:
+        while size > 0:
+            chunk = f.read(min(size, 1 << 20))
+            if not chunk:
+                break
+            h.update(chunk)
+            size -= len(chunk)
+    return h.hexdigest()
+
+
+def load_verified_state(filepath: str) -> Optional[Dict[str, Any]]:
+    """
+    Load the point up to which the file last verified.
+    
+    The chain is append-only, so if the file still starts with exactly the
+    bytes that verified, only entries after that point need checking.
+    
+    Returns:
+        Dict with offset, lines, entry_count and last_hash, or None if
+        there is no sidecar or the verified bytes have changed
+    """
+    try:
+        with open(_verified_state_path(filepath), 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        offset = state["offset"]
+        if os.path.getsize(filepath) < offset:
+            return None
+        if _prefix_digest(filepath, offset) != state["sha256"]:
+            return None
+        return state
+    except Exception:
+        return None
+
+
+def save_verified_state(
+    filepath: str,
+    offset: int,
+    lines: int,
+    entry_count: int,
+    last_hash: str,
+) -> None:
+    """Record how far the file verified in a sidecar. Failures are ignored."""
+    try:
+        state = {
+            "offset": offset,
+            "lines": lines,
+            "entry_count": entry_count,
+            "last_hash": last_hash,
+            "sha256": _prefix_digest(filepath, offset),
+        }
+        with open(_verified_state_path(filepath), 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+    except Exception:
+        pass
+
+
+# Timestamps as the audit writers emit them. For these the formatted
+# form depends only on the first 19 characters (date and whole seconds),
+# and a valid date/time there means the whole string parses.
+_ISO_TIMESTAMP = re.compile(
+    r"\d{4}-\d\d-\d\d[T ]\d\d:\d\d:\d\d"
+    r"(?:\.(?:\d{3}|\d{6}))?"
+    r"(?:Z|[+-](?:[01]\d|2[0-3]):[0-5]\d)?"
+)
+
+
+@lru_cache(maxsize=4096)
+def _format_second(prefix: str) -> Optional[str]:
+    """Format a 'YYYY-MM-DDTHH:MM:SS' prefix, or None if it is not a valid time."""
+    try:
+        return datetime.fromisoformat(prefix).strftime("%Y-%m-%d %H:%M:%S")
+    except ValueError:
+        return None
+
+
 def format_timestamp(ts: str) -> str:
-    """Format ISO timestamp to human-readable form."""
+    """
+    Format ISO timestamp to human-readable form.
+    
+    Entries written within the same second share one cached parse.
+    """
+    if isinstance(ts, str) and _ISO_TIMESTAMP.fullmatch(ts):
+        formatted = _format_second(ts[:19])
+        if formatted is not None:
+            return formatted
     try:
         dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
         return dt.strftime("%Y-%m-%d %H:%M:%S")
@@ -101,6 +265,12 @@ def format_timestamp(ts: str) -> str:
         return ts
 
 
+# Timeline lines buffered between writes to stdout
+_TIMELINE_FLUSH_LINES = 4096
+# Status column for each decision; anything else shows as "[???] "
+_TIMELINE_STATUS = {"HALT": "[HALT]", "ALLOW": "[OK]  "}
+
+
 def print_timeline(entries: List[Dict], verbose: bool = False) -> None:
     """Print human-readable timeline of governance decisions."""
     if not entries:
@@ -119,22 +289,26 @@ def print_timeline(entries: List[Dict], verbose: bool = False) -> None:
     
     print("=" * 70 + "\n")
     
+    # Lines are collected and written in blocks rather than one print()
+    # call each
+    lines: List[str] = []
+    add = lines.append
+    write = sys.stdout.write
+    
     for i, entry in enumerate(entries):
         step = entry.get("step", i + 1)
         action = entry.get("action", "unknown")
         decision = entry.get("decision", "UNKNOWN")
         timestamp = format_timestamp(entry.get("timestamp", ""))
         
-        # Status indicator
-        if decision == "HALT":
-            status = "[HALT]"
-        elif decision == "ALLOW":
-            status = "[OK]  "
+        # Status indicator (decision can be any JSON value, lists included)
+        if isinstance(decision, str):
+            status = _TIMELINE_STATUS.get(decision, "[???] ")
         else:
             status = "[???] "
         
         # Print main line
-        print(f"Step {step:3d} {status} | {timestamp} | action={action}")
+        add(f"Step {step:3d} {status} | {timestamp} | action={action}")
         
         # Print budgets if available
         budgets = entry.get("budgets", {})
@@ -145,29 +319,37 @@ def print_timeline(entries: List[Dict], verbose: bool = False) -> None:
             exploration = budgets.get("exploration", "?")
             
             if isinstance(effort, float):
-                print(f"         budgets: effort={effort:.3f} risk={risk:.3f} persistence={persistence:.3f} exploration={exploration:.3f}")
+                add(f"         budgets: effort={effort:.3f} risk={risk:.3f} persistence={persistence:.3f} exploration={exploration:.3f}")
             else:
-                print(f"         budgets: effort={effort} risk={risk}")
+                add(f"         budgets: effort={effort} risk={risk}")
         
         # Print halt reason if halted
         halt_reason = entry.get("halt_reason")
         if halt_reason:
-            print(f"         HALT REASON: {halt_reason}")
+            add(f"         HALT REASON: {halt_reason}")
         
         # Print signals if verbose
         if verbose:
             signals = entry.get("signals", {})
             if signals:
                 sig_str = ", ".join(f"{k}={v}" for k, v in signals.items())
-                print(f"         signals: {sig_str}")
+                add(f"         signals: {sig_str}")
         
         # Print hash (truncated)
         if verbose:
             entry_hash = entry.get("entry_hash", "")
             if entry_hash:
-                print(f"         hash: {entry_hash[:32]}...")
+                add(f"         hash: {entry_hash[:32]}...")
         
-        print()
+        add("")
+        if len(lines) >= _TIMELINE_FLUSH_LINES:
+            write("\n".join(lines))
+            write("\n")
+            lines.clear()
+    
+    if lines:
+        write("\n".join(lines))
+        write("\n")
 
 
 def print_summary(entries: List[Dict]) -> None:
@@ -177,15 +359,19 @@ def print_summary(entries: List[Dict]) -> None:
         return
     
     total = len(entries)
-    allows = sum(1 for e in entries if e.get("decision") == "ALLOW")
-    halts = sum(1 for e in entries if e.get("decision") == "HALT")
     
-    # Collect halt reasons
-    halt_reasons: Dict[str, int] = {}
+    # Count decisions and halt reasons in one pass
+    allows = halts = 0
+    halt_reasons: Counter = Counter()
     for entry in entries:
+        decision = entry.get("decision")
+        if decision == "ALLOW":
+            allows += 1
+        elif decision == "HALT":
+            halts += 1
         reason = entry.get("halt_reason")
         if reason:
-            halt_reasons[reason] = halt_reasons.get(reason, 0) + 1
+            halt_reasons[reason] += 1
     
     # Find final state
     final = entries[-1] if entries else {}
@@ -214,7 +400,7 @@ def print_summary(entries: List[Dict]) -> None:
     print("=" * 50 + "\n")
 
 
-def main():
+def main(argv: Optional[List[str]] = None):
     parser = argparse.ArgumentParser(
         description="Offline audit replay tool for Agent Harness governance logs.",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -233,7 +419,10 @@ Examples:
     parser.add_argument(
         "--verify", "-v",
         action="store_true",
-        help="Only verify chain integrity, no timeline"
+        help="Only verify chain integrity, no timeline. Records how far the "
+             "chain verified in a .verified.json sidecar and, while the file "
+             "still starts with those bytes, later runs only check entries "
+             "appended since (see --full)"
     )
     parser.add_argument(
         "--summary", "-s",
@@ -245,24 +434,52 @@ Examples:
         action="store_true",
         help="Show detailed information (signals, hashes)"
     )
+    parser.add_argument(
+        "--full", "--no-cache",
+        dest="full",
+        action="store_true",
+        help="With --verify: re-verify from the first entry; ignore and do "
+             "not write the .verified.json sidecar"
+    )
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    
+    # --verify resumes from the last verified point if the file still
+    # starts with the bytes that verified, and only reads the appended tail.
+    # Timeline and summary runs always check the whole chain and leave no
+    # sidecar behind.
+    use_sidecar = args.verify and not args.full
+    state = load_verified_state(args.filepath) if use_sidecar else None
+    tail_only = state is not None
     
     # Load file
-    entries, error = load_audit_file(args.filepath)
+    if tail_only:
+        entries, end, lines, error = read_audit_entries(
+            args.filepath, state["offset"], state["lines"] + 1
+        )
+    else:
+        entries, end, lines, error = read_audit_entries(args.filepath)
     if error:
         print(f"[ERROR] {error}")
         sys.exit(1)
     
-    if not entries:
+    verified = state["entry_count"] if tail_only else 0
+    total = verified + len(entries)
+    if not total:
         print("[INFO] No entries in audit file.")
         sys.exit(0)
     
     # Verify chain
-    is_valid, verify_error = verify_chain(entries)
+    prev_hash = state["last_hash"] if tail_only else ""
+    is_valid, verify_error = verify_chain(entries, prev_hash, verified)
+    if is_valid and entries and use_sidecar:
+        save_verified_state(
+            args.filepath, end, lines, total, entries[-1].get("entry_hash", "")
+        )
     
     if is_valid:
-        print(f"[PASS] Chain verified: {len(entries)} entries, integrity OK")
+        note = f" ({verified} previously verified)" if verified else ""
+        print(f"[PASS] Chain verified: {total} entries, integrity OK{note}")
     else:
         print(f"[FAIL] Chain verification failed: {verify_error}")
         if args.verify:
@@ -7,24 +7,29 @@ Run with: python start_proxy.py
 Options:
     --host: Host to bind to (default: 0.0.0.0)
     --port: Port to bind to (default: 8000)
+    --workers: Worker processes (default: $GOVERNANCE_PROXY_WORKERS or 1)
 """
 
 import os
 import sys
 import argparse
 
-# Add src to path FIRST to avoid conflicts with installed packages
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+# Fall back to the source tree when the package is not installed
+try:
+    import governance  # noqa: F401
+except ImportError:
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
 
 def main():
     parser = argparse.ArgumentParser(description='Start the Governance Proxy Enforcer')
     parser.add_argument('--host', default='0.0.0.0', help='Host to bind to')
     parser.add_argument('--port', type=int, default=8000, help='Port to bind to')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker processes (governance state is per worker)')
     args = parser.parse_args()
     
     # Import after path is set
-    from governance.proxy_enforcer import create_app
-    import uvicorn
+    from governance.proxy_enforcer import run, PROXY_WORKERS
     
     print(f"Starting Governance Proxy Enforcer...")
     print(f"  Health:  http://{args.host}:{args.port}/health")
@@ -33,8 +38,7 @@ def main():
     print(f"  Tools:   POST http://{args.host}:{args.port}/tool/{{tool_name}}")
     print("-" * 50)
     
-    app = create_app()
-    uvicorn.run(app, host=args.host, port=args.port)
+    run(host=args.host, port=args.port, workers=args.workers or PROXY_WORKERS)
 
 
 if __name__ == "__main__":
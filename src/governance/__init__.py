@@ -12,7 +12,7 @@ Usage:
 """
 
 from governance.agent import GovernanceAgent
-from governance.auto import governed
+from governance.auto import governed, get_gov
 from governance.interface import step, observe, Signals
 from governance.observation import Observation
 from governance.adapters import LLMLoopAdapter, ToolCallingAgentAdapter
@@ -47,6 +47,7 @@ __all__ = [
     "GovernanceAgent",
     "EmoCoreAgent",  # Alias
     "governed",
+    "get_gov",
     "step",
     "observe",
     "Signals",
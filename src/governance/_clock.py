@@ -0,0 +1,41 @@
+# Governance Engine/_clock.py
+"""
+UTC timestamp formatting shared by the audit and metrics layers.
+
+Timestamps are produced in the same form as
+datetime.now(timezone.utc).isoformat(), which persisted audit chains and
+metrics files already use. The "YYYY-MM-DDTHH:MM:SS" prefix is formatted
+once per second; each call only formats the microseconds.
+"""
+import time
+from typing import Optional
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") for the last timestamp formatted.
+# Replaced as a whole tuple, so concurrent readers never see a torn pair.
+_TS_CACHE = (-1, "")
+
+
+def utc_timestamp(timestamp_ns: Optional[int] = None) -> str:
+    """
+    Format a UTC timestamp as isoformat() would.
+    
+    Args:
+        timestamp_ns: Nanoseconds since the epoch, e.g. from time.time_ns()
+            taken once per step and shared by several records. Defaults to
+            the current time.
+    
+    Returns:
+        ISO 8601 string with a +00:00 offset
+    """
+    global _TS_CACHE
+    if timestamp_ns is None:
+        timestamp_ns = time.time_ns()
+    seconds, nanos = divmod(timestamp_ns, 1_000_000_000)
+    cached_seconds, prefix = _TS_CACHE
+    if seconds != cached_seconds:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        _TS_CACHE = (seconds, prefix)
+    micros = nanos // 1000
+    if micros:
+        return f"{prefix}.{micros:06d}+00:00"
+    return f"{prefix}+00:00"
@@ -0,0 +1,81 @@
+# Governance Engine/_kernel_jit.py
+"""
+Scalar governance math with optional Numba JIT.
+
+The per-step budget computation works on a 5-axis state and a 4-dimension
+budget. At that size NumPy call overhead dominates the arithmetic, so the
+math is written as plain scalar code over flattened coefficient tuples.
+
+If numba is installed the function is compiled with @njit(cache=True).
+fastmath is deliberately NOT enabled: reassociation would make results
+depend on whether numba is present, breaking the determinism invariant.
+
+Invariants:
+- Deterministic: same inputs  same outputs, with or without numba
+- Pure: no side effects
+"""
+from typing import Tuple
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _maybe_njit(fn):
+    """Compile fn with numba when available, otherwise return it unchanged."""
+    if NUMBA_AVAILABLE:
+        return numba.njit(cache=True)(fn)
+    return fn
+
+
+@_maybe_njit
+def governance_math(
+    s0: float, s1: float, s2: float, s3: float, s4: float,
+    w_cols: Tuple[Tuple[float, ...], ...],
+    v_cols: Tuple[Tuple[float, ...], ...],
+    stagnation_effort_scale: float,
+    stagnation_persistence_scale: float,
+    effort_scale: float,
+    risk_scale: float,
+    exploration_scale: float,
+    persistence_scale: float,
+    decay_expl: float,
+    decay_pers: float,
+) -> Tuple[float, float, float, float]:
+    """
+    Compute the clipped budget vector g = W.T @ s - V.T @ s.
+
+    Args:
+        s0..s4: Control state axes (margin, loss, pressure, urgency, risk)
+        w_cols: Enabling matrix columns, one 5-tuple per budget dimension
+        v_cols: Suppressive matrix columns, one 5-tuple per budget dimension
+        stagnation_*_scale: Stagnation multipliers (1.0 when not stagnating)
+        *_scale: Profile multipliers (1.0 without a profile)
+        decay_expl, decay_pers: Combined step + time decay (0.0 without a profile)
+
+    Returns:
+        (effort, risk, exploration, persistence), each clamped to [0.0, 1.0]
+    """
+    g = [0.0, 0.0, 0.0, 0.0]
+    for j in range(4):
+        w = w_cols[j]
+        v = v_cols[j]
+        g[j] = (
+            (w[0] * s0 + w[1] * s1 + w[2] * s2 + w[3] * s3 + w[4] * s4)
+            - (v[0] * s0 + v[1] * s1 + v[2] * s2 + v[3] * s3 + v[4] * s4)
+        )
+
+    # Stagnation scaling, then profile scaling (kept as separate multiplies)
+    effort = g[0] * stagnation_effort_scale * effort_scale
+    risk = g[1] * risk_scale
+    exploration = g[2] * exploration_scale - decay_expl
+    persistence = g[3] * stagnation_persistence_scale * persistence_scale - decay_pers
+
+    return (
+        min(max(effort, 0.0), 1.0),
+        min(max(risk, 0.0), 1.0),
+        min(max(exploration, 0.0), 1.0),
+        min(max(persistence, 0.0), 1.0),
+    )
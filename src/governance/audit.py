@@ -22,25 +22,49 @@ Usage:
     python -m governance.audit verify audit_chain.jsonl
 """
 
+import atexit
+import concurrent.futures
 import json
 import hashlib
+import os
+import queue
 import sys
+import threading
+import weakref
 import dataclasses
+from collections import deque
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Deque, Dict, List, Optional, Union
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Handle import when run as module vs imported
 try:
+    from governance._clock import utc_timestamp
+    from governance.behavior import BehaviorBudget
     from governance.result import EngineResult
 except ImportError:
-    import os
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from governance._clock import utc_timestamp
+    from governance.behavior import BehaviorBudget
     from governance.result import EngineResult
 
+# BehaviorBudget holds only float fields, so a flat field lookup replaces
+# the recursive copy done by dataclasses.asdict.
+_BUDGET_FIELDS = tuple(f.name for f in dataclasses.fields(BehaviorBudget))
+
+
+def _budget_dict(budget: BehaviorBudget) -> Dict[str, float]:
+    """Snapshot a BehaviorBudget as a plain dict."""
+    return {name: getattr(budget, name) for name in _BUDGET_FIELDS}
+
 
-@dataclass
+@dataclass(slots=True)
 class AuditEntry:
     """
     Immutable record of a single governance event.
@@ -62,23 +86,75 @@ class AuditEntry:
     entry_hash: str = ""
 
 
+def _entry_to_dict(entry: AuditEntry) -> Dict[str, Any]:
+    """
+    Field dict of an AuditEntry.
+    
+    Same keys and values as dataclasses.asdict, but nested dicts are shared
+    rather than deep-copied.
+    """
+    return {
+        'timestamp': entry.timestamp,
+        'step': entry.step,
+        'action': entry.action,
+        'params': entry.params,
+        'signals': entry.signals,
+        'budget_snapshot': entry.budget_snapshot,
+        'decision_halted': entry.decision_halted,
+        'halt_reason': entry.halt_reason,
+        'previous_hash': entry.previous_hash,
+        'entry_hash': entry.entry_hash,
+    }
+
+
+# Reused encoder for canonical JSON. Output is byte-identical to
+# json.dumps(obj, sort_keys=True, separators=(',', ':')), which existing
+# chain files and scripts/replay_audit.py depend on.
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, separators=(',', ':'))
+_canonical_encode = _CANONICAL_ENCODER.encode
+_sha256 = hashlib.sha256
+
+
+def _loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON document, using orjson when it is installed.
+    
+    orjson is only used for parsing. It is not used to produce canonical
+    JSON because its float and non-ASCII formatting differ from the stdlib
+    encoder (e.g. 1e16 vs 1e+16, raw vs \\u-escaped UTF-8), which would
+    change entry hashes. Documents orjson rejects
+    (NaN literals, integers wider than 64 bits) fall back to json.loads.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
 def canonical_json(obj: Dict[str, Any]) -> str:
     """
     Produce canonical JSON for hashing.
     
     Uses sorted keys and no extra whitespace to ensure determinism.
     """
-    return json.dumps(obj, sort_keys=True, separators=(',', ':'))
+    return _canonical_encode(obj)
+
+
+def _hash_canonical(hashable: Dict[str, Any]) -> str:
+    """SHA256 hex digest of the canonical JSON of a dict without entry_hash."""
+    return _sha256(_canonical_encode(hashable).encode('utf-8')).hexdigest()
 
 
 def compute_entry_hash(entry_dict: Dict[str, Any]) -> str:
     """
     Compute SHA256 hash of an entry (excluding entry_hash field).
     """
-    # Create a copy without entry_hash
-    hashable = {k: v for k, v in entry_dict.items() if k != "entry_hash"}
-    canonical = canonical_json(hashable)
-    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+    if "entry_hash" in entry_dict:
+        # Hash a copy without entry_hash; the caller's dict is left intact
+        entry_dict = {k: v for k, v in entry_dict.items() if k != "entry_hash"}
+    return _hash_canonical(entry_dict)
 
 
 class AuditLogger:
@@ -105,12 +181,12 @@ class AuditLogger:
             result: The output result from kernel
         """
         entry = AuditEntry(
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=utc_timestamp(),
             step=step,
             action=action,
             params=params,
             signals=signals,
-            budget_snapshot=dataclasses.asdict(result.budget),
+            budget_snapshot=_budget_dict(result.budget),
             decision_halted=result.halted,
             halt_reason=result.reason
         )
@@ -120,7 +196,7 @@ class AuditLogger:
         """
         Return all entries as a list of dictionaries (JSON-serializable).
         """
-        return [dataclasses.asdict(entry) for entry in self._entries]
+        return [_entry_to_dict(entry) for entry in self._entries]
 
     def dump_json(self, filepath: Optional[str] = None) -> str:
         """
@@ -136,6 +212,88 @@ class AuditLogger:
         return json_str
 
 
+# Files smaller than this are verified in-process even when workers > 1;
+# below it process start-up costs more than the hashing saved.
+_PARALLEL_MIN_BYTES = 4 << 20
+
+
+def _hash_page(filepath: str, begin: int, end: int) -> tuple:
+    """
+    Verify the lines of one byte range of a chain file (verify_chain worker).
+    
+    The page owns every line that starts in [begin, end). Linkage inside the
+    page is checked here; only the page boundary is left to the caller.
+    
+    Returns:
+        (line_count, first_line, first_previous_hash, last_entry_hash, error)
+        where first_line is the local line number of the page's first entry,
+        the hashes are None for a page with no entries, and error is None or
+        (local_line_num, kind, a, b) for the first failure in the page.
+    """
+    first_line = 0
+    first_prev: Optional[str] = None
+    previous_hash: Optional[str] = None
+    line_num = 0
+    with open(filepath, 'rb', buffering=1 << 20) as f:
+        if begin:
+            # Skip the partial line owned by the previous page
+            f.seek(begin - 1)
+            f.readline()
+        pos = f.tell()
+        while pos < end:
+            line = f.readline()
+            if not line:
+                break
+            pos += len(line)
+            line_num += 1
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = _loads(line)
+            except ValueError as e:
+                return line_num, first_line, first_prev, previous_hash, (
+                    line_num, "json", str(e), None
+                )
+            entry_prev = entry.get("previous_hash", "")
+            if previous_hash is None:
+                first_line = line_num
+                first_prev = entry_prev
+            elif entry_prev != previous_hash:
+                return line_num, first_line, first_prev, previous_hash, (
+                    line_num, "link", previous_hash, entry_prev
+                )
+            stored_hash = entry.pop("entry_hash", "")
+            computed_hash = _hash_canonical(entry)
+            if stored_hash != computed_hash:
+                return line_num, first_line, first_prev, previous_hash, (
+                    line_num, "hash", stored_hash, computed_hash
+                )
+            previous_hash = stored_hash
+    return line_num, first_line, first_prev, previous_hash, None
+
+
+# Sentinel that tells the background writer thread to exit.
+_WRITER_STOP = object()
+# Maximum number of lines the background writer joins into one write.
+_WRITER_BATCH = 256
+# Buffered bytes that force a flush regardless of flush_every.
+_FLUSH_BYTES = 64 * 1024
+
+# Loggers with a file attached; any still open are closed at interpreter exit
+# so buffered entries are not lost.
+_OPEN_LOGGERS: "weakref.WeakSet[HashChainedAuditLogger]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_loggers() -> None:
+    for logger in list(_OPEN_LOGGERS):
+        try:
+            logger.close()
+        except Exception:
+            pass
+
+
 class HashChainedAuditLogger:
     """
     Audit logger with SHA256 hash chaining for tamper detection.
@@ -149,31 +307,82 @@ class HashChainedAuditLogger:
         Entry[0]: previous_hash = "", entry_hash = SHA256(entry_0)
         Entry[1]: previous_hash = entry_0.entry_hash, entry_hash = SHA256(entry_1)
         Entry[N]: previous_hash = entry_N-1.entry_hash, entry_hash = SHA256(entry_N)
+    
+    Background Writing:
+        With background=True, hashing still happens inline in log() (so the
+        chain order is fixed by the caller), but file writes are handed to a
+        single writer thread that batches queued lines. Call close() before
+        reading the file back.
     """
     
-    def __init__(self, filepath: Optional[str] = None):
+    def __init__(self,
+                 filepath: Optional[str] = None,
+                 flush_every: int = 1,
+                 background: bool = False,
+                 durable: bool = False,
+                 max_in_memory_entries: Optional[int] = 10_000):
         """
         Initialize hash-chained audit logger.
         
         Args:
             filepath: Path to JSONL file for persistence (optional)
+            flush_every: Flush the file every N entries (default 1, i.e.
+                every entry is on disk when log() returns). Larger values
+                trade durability for throughput; call flush() or close()
+                before reading the file back. The buffer is also flushed
+                once it holds 64 KiB, and on interpreter exit.
+            background: Write the JSONL file from a background thread
+                instead of blocking log() on disk I/O.
+            durable: fsync the file after every write. Combined with
+                flush_every or background this is a group commit: one
+                fsync per batch rather than per entry.
+            max_in_memory_entries: Number of recent entries kept in memory
+                for dump()/dump_jsonl() when persisting to a file; the full
+                history stays in the file. None keeps every entry. Ignored
+                without a filepath, since memory is then the only record.
         """
-        self._entries: List[AuditEntry] = []
+        if flush_every < 1:
+            raise ValueError("flush_every must be >= 1")
+        if max_in_memory_entries is not None and max_in_memory_entries < 1:
+            raise ValueError("max_in_memory_entries must be >= 1 or None")
+        self._entries: Deque[AuditEntry] = deque(
+            maxlen=max_in_memory_entries if filepath else None
+        )
         self._filepath = filepath
+        self._path: Optional[Path] = Path(filepath) if filepath else None
         self._last_hash = ""
         self._entries_written = 0
+        self._flush_every = flush_every
+        self._durable = durable
+        self._buf = bytearray()
+        self._buffered = 0
+        self._fd: Optional[int] = None
+        self._lock = threading.Lock()
+        self._queue: Optional[queue.Queue] = None
+        self._writer: Optional[threading.Thread] = None
+        self._writer_error: Optional[BaseException] = None
         
         # Load existing entries if file exists
-        if filepath and Path(filepath).exists():
+        if self._path is not None and self._path.exists():
             self._load_existing()
+        
+        if filepath and background:
+            self._queue = queue.Queue(maxsize=1024)
+            self._writer = threading.Thread(
+                target=self._drain, name="audit-writer", daemon=True
+            )
+            self._writer.start()
+        
+        if filepath:
+            _OPEN_LOGGERS.add(self)
     
     def _load_existing(self) -> None:
         """Load existing entries from file."""
-        with open(self._filepath, 'r') as f:
+        with self._path.open('rb') as f:
             for line in f:
                 line = line.strip()
                 if line:
-                    entry_dict = json.loads(line)
+                    entry_dict = _loads(line)
                     entry = AuditEntry(**entry_dict)
                     self._entries.append(entry)
                     self._last_hash = entry.entry_hash
@@ -198,73 +407,168 @@ class HashChainedAuditLogger:
         Returns:
             The created AuditEntry with computed hashes
         """
-        # Create entry without hashes first
-        entry = AuditEntry(
-            timestamp=datetime.now(timezone.utc).isoformat(),
-            step=step,
-            action=action,
-            params=params,
-            signals=signals,
-            budget_snapshot=dataclasses.asdict(result.budget),
-            decision_halted=result.halted,
-            halt_reason=result.reason,
-            previous_hash=self._last_hash,
-            entry_hash="",  # Will compute below
-        )
+        with self._lock:
+            # Create entry without hashes first
+            entry = AuditEntry(
+                timestamp=utc_timestamp(),
+                step=step,
+                action=action,
+                params=params,
+                signals=signals,
+                budget_snapshot=_budget_dict(result.budget),
+                decision_halted=result.halted,
+                halt_reason=result.reason,
+                previous_hash=self._last_hash,
+                entry_hash="",  # Will compute below
+            )
         
-        # Convert to dict and compute hash
-        entry_dict = dataclasses.asdict(entry)
-        entry_hash = compute_entry_hash(entry_dict)
+            # Serialize once: the canonical body (entry_hash excluded) is both
+            # the hash input and, with entry_hash appended, the JSONL line.
+            entry_dict = _entry_to_dict(entry)
+            del entry_dict["entry_hash"]
+            body = _canonical_encode(entry_dict)
+            entry_hash = _sha256(body.encode('utf-8')).hexdigest()
+            entry.entry_hash = entry_hash
         
-        # Create final entry with hash
-        entry = AuditEntry(
-            timestamp=entry.timestamp,
-            step=entry.step,
-            action=entry.action,
-            params=entry.params,
-            signals=entry.signals,
-            budget_snapshot=entry.budget_snapshot,
-            decision_halted=entry.decision_halted,
-            halt_reason=entry.halt_reason,
-            previous_hash=entry.previous_hash,
-            entry_hash=entry_hash,
-        )
+            self._entries.append(entry)
+            self._last_hash = entry_hash
         
-        self._entries.append(entry)
-        self._last_hash = entry_hash
+            # Persist to file (append-only)
+            if self._filepath:
+                self._append_to_file(
+                    f'{body[:-1]},"entry_hash":"{entry_hash}"}}\n'.encode('ascii')
+                )
         
-        # Persist to file (append-only)
-        if self._filepath:
-            self._append_to_file(entry)
+            self._entries_written += 1
+            return entry
+    
+    def _append_to_file(self, line: bytes) -> None:
+        """Append a single serialized JSONL line to the file."""
+        if self._queue is not None:
+            self._queue.put(line)
+            return
+        self._buf += line
+        self._buffered += 1
+        if self._buffered >= self._flush_every or len(self._buf) >= _FLUSH_BYTES:
+            self.flush()
+    
+    def _write(self, data: Union[bytes, bytearray]) -> None:
+        """
+        Append raw bytes with O_APPEND writes, opening the file lazily.
         
-        self._entries_written += 1
-        return entry
+        If a write fails after part of a bytearray went out, that part is
+        removed from its front before the error propagates, so writing the
+        same buffer again completes the torn line instead of repeating it.
+        """
+        if self._fd is None:
+            self._fd = os.open(
+                self._filepath, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644
+            )
+        written = 0
+        try:
+            with memoryview(data) as view:
+                while written < len(view):
+                    chunk = view[written:]
+                    try:
+                        written += os.write(self._fd, chunk)
+                    finally:
+                        chunk.release()
+        except BaseException:
+            if written and isinstance(data, bytearray):
+                del data[:written]
+            raise
+        if self._durable:
+            os.fsync(self._fd)
+    
+    def _drain(self) -> None:
+        """Background writer loop: batch queued lines into single writes."""
+        q = self._queue
+        while True:
+            items = [q.get()]
+            while len(items) < _WRITER_BATCH:
+                try:
+                    items.append(q.get_nowait())
+                except queue.Empty:
+                    break
+            batch = [item for item in items if item is not _WRITER_STOP]
+            try:
+                if batch:
+                    self._write(b"".join(batch))
+            except Exception as e:
+                # Keep draining so flush()/close() never block; the error is
+                # re-raised to the caller from there.
+                self._writer_error = e
+            finally:
+                for _ in items:
+                    q.task_done()
+            if len(batch) != len(items):
+                return
     
-    def _append_to_file(self, entry: AuditEntry) -> None:
-        """Append a single entry to the JSONL file."""
-        with open(self._filepath, 'a') as f:
-            f.write(json.dumps(dataclasses.asdict(entry)) + '\n')
+    def _raise_writer_error(self) -> None:
+        """Re-raise an exception captured by the background writer."""
+        if self._writer_error is not None:
+            error, self._writer_error = self._writer_error, None
+            raise error
+    
+    def flush(self) -> None:
+        """Flush buffered entries to the JSONL file."""
+        if self._queue is not None:
+            self._queue.join()
+            self._raise_writer_error()
+        if self._buf:
+            # On failure the unwritten bytes stay buffered and the OSError
+            # propagates; the next flush() retries them
+            self._write(self._buf)
+            self._buf.clear()
+            self._buffered = 0
+    
+    def close(self) -> None:
+        """Flush and close the JSONL file handle."""
+        if self._writer is not None:
+            self._queue.put(_WRITER_STOP)
+            self._writer.join()
+            self._writer = None
+            self._queue = None
+        try:
+            self.flush()
+        finally:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+            _OPEN_LOGGERS.discard(self)
+        self._raise_writer_error()
+    
+    def __enter__(self) -> "HashChainedAuditLogger":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
     
     def dump(self) -> List[Dict[str, Any]]:
-        """Return all entries as a list of dictionaries."""
-        return [dataclasses.asdict(entry) for entry in self._entries]
+        """Return the in-memory entries as a list of dictionaries."""
+        return [_entry_to_dict(entry) for entry in self._entries]
     
     def dump_jsonl(self, filepath: Optional[str] = None) -> str:
         """
         Export to JSONL format.
         
+        Lines use the same compact, key-sorted encoding as the persisted
+        chain file.
+        
         Args:
             filepath: If provided, write to file
             
         Returns:
             JSONL string
         """
-        lines = [json.dumps(dataclasses.asdict(e)) for e in self._entries]
+        lines = [_canonical_encode(_entry_to_dict(e)) for e in self._entries]
         content = '\n'.join(lines)
         
         if filepath:
             with open(filepath, 'w') as f:
-                f.write(content + '\n')
+                # Two writes rather than content + '\n', which copies the export
+                f.write(content)
+                f.write('\n')
         
         return content
     
@@ -274,12 +578,29 @@ class HashChainedAuditLogger:
         return self._entries_written
     
     @staticmethod
-    def verify_chain(filepath: str) -> tuple[bool, Optional[str]]:
+    def verify_chain(filepath: str,
+                     start: int = 0,
+                     limit: Optional[int] = None,
+                     start_offset: int = 0,
+                     workers: int = 1) -> tuple[bool, Optional[str]]:
         """
         Verify the integrity of an audit chain file.
         
+        The file is streamed line by line; only the rolling previous hash is
+        kept, so memory use is independent of chain length.
+        
         Args:
             filepath: Path to the JSONL audit chain file
+            start: Index of the first entry to verify (0 = genesis). When
+                start > 0 the stored previous_hash of that entry is taken as
+                the anchor; earlier entries are skipped without hashing.
+            limit: Maximum number of entries to verify (None = all)
+            start_offset: Byte offset to seek to before reading; must be the
+                start of a line. Like start > 0, the first entry read is the
+                anchor. Line numbers in errors are counted from the offset.
+            workers: Number of processes used to recompute entry hashes for
+                a full-chain check. Only the linkage pass is sequential.
+                Ignored for windowed checks and files under 4 MiB.
             
         Returns:
             Tuple of (is_valid, error_message)
@@ -289,44 +610,95 @@ class HashChainedAuditLogger:
         if not Path(filepath).exists():
             return False, f"File not found: {filepath}"
         
-        entries = []
-        with open(filepath, 'r') as f:
+        if (workers > 1 and start == 0 and limit is None and start_offset == 0
+                and os.path.getsize(filepath) >= _PARALLEL_MIN_BYTES):
+            return HashChainedAuditLogger._verify_chain_parallel(filepath, workers)
+        
+        previous_hash: Optional[str] = "" if start == 0 and start_offset == 0 else None
+        index = 0
+        checked = 0
+        
+        with open(filepath, 'rb', buffering=1 << 20) as f:
+            if start_offset:
+                f.seek(start_offset)
             for line_num, line in enumerate(f, 1):
                 line = line.strip()
                 if not line:
                     continue
+                if index < start:
+                    index += 1
+                    continue
+                if limit is not None and checked >= limit:
+                    break
+                index += 1
+                checked += 1
+                
                 try:
-                    entry = json.loads(line)
-                    entries.append((line_num, entry))
-                except json.JSONDecodeError as e:
+                    entry = _loads(line)
+                except ValueError as e:
                     return False, f"Invalid JSON on line {line_num}: {e}"
+                
+                # Check previous_hash linkage
+                if previous_hash is None:
+                    previous_hash = entry.get("previous_hash", "")
+                if entry.get("previous_hash", "") != previous_hash:
+                    return False, (
+                        f"Line {line_num}: previous_hash mismatch. "
+                        f"Expected '{previous_hash[:16]}...', "
+                        f"got '{entry.get('previous_hash', '')[:16]}...'"
+                    )
+                
+                # Verify entry_hash (the parsed dict is ours, so pop in place)
+                stored_hash = entry.pop("entry_hash", "")
+                computed_hash = _hash_canonical(entry)
+                
+                if stored_hash != computed_hash:
+                    return False, (
+                        f"Line {line_num}: entry_hash mismatch. "
+                        f"Stored '{stored_hash[:16]}...', "
+                        f"computed '{computed_hash[:16]}...'"
+                    )
+                
+                previous_hash = stored_hash
         
-        if not entries:
-            return True, None  # Empty file is valid
+        return True, None
+    
+    @staticmethod
+    def _verify_chain_parallel(filepath: str, workers: int) -> tuple[bool, Optional[str]]:
+        """Verify a full chain with per-page hashing in worker processes."""
+        size = os.path.getsize(filepath)
+        bounds = [size * i // workers for i in range(workers + 1)]
         
-        previous_hash = ""
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+            pages = list(pool.map(
+                _hash_page, [filepath] * workers, bounds[:-1], bounds[1:]
+            ))
         
-        for line_num, entry in entries:
-            # Check previous_hash linkage
-            if entry.get("previous_hash", "") != previous_hash:
-                return False, (
-                    f"Line {line_num}: previous_hash mismatch. "
-                    f"Expected '{previous_hash[:16]}...', "
-                    f"got '{entry.get('previous_hash', '')[:16]}...'"
-                )
-            
-            # Verify entry_hash
-            stored_hash = entry.get("entry_hash", "")
-            computed_hash = compute_entry_hash(entry)
-            
-            if stored_hash != computed_hash:
+        # Stitch pages in file order. A page's first entry is linked to the
+        # previous page before its own error is reported, matching the check
+        # order (and so the first error) of the streaming path.
+        previous_hash = ""
+        line_base = 0
+        for line_count, first_line, first_prev, last_hash, error in pages:
+            if first_prev is not None and first_prev != previous_hash:
+                error = (first_line, "link", previous_hash, first_prev)
+            if error is not None:
+                local_num, kind, a, b = error
+                line_num = line_base + local_num
+                if kind == "json":
+                    return False, f"Invalid JSON on line {line_num}: {a}"
+                if kind == "link":
+                    return False, (
+                        f"Line {line_num}: previous_hash mismatch. "
+                        f"Expected '{a[:16]}...', got '{b[:16]}...'"
+                    )
                 return False, (
                     f"Line {line_num}: entry_hash mismatch. "
-                    f"Stored '{stored_hash[:16]}...', "
-                    f"computed '{computed_hash[:16]}...'"
+                    f"Stored '{a[:16]}...', computed '{b[:16]}...'"
                 )
-            
-            previous_hash = stored_hash
+            if last_hash is not None:
+                previous_hash = last_hash
+            line_base += line_count
         
         return True, None
 
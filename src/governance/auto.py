@@ -1,6 +1,8 @@
 # Governance Engine/auto.py
+import sys
 import time
 import functools
+import weakref
 from typing import Callable, Any, Optional
 from dataclasses import dataclass
 
@@ -9,6 +11,57 @@ from governance.interface import observe
 from governance.observation import Observation
 from governance.guarantees import StepResult
 
+def _size_proxy(result: Any) -> float:
+    """
+    Estimate output size in [0, 1] without stringifying the result.
+    
+    Strings and bytes count characters (1000 = full), containers count
+    items (100 = full), anything else falls back to its shallow size.
+    """
+    if not result:
+        return 0.0
+    if isinstance(result, (str, bytes)):
+        return min(1.0, len(result) / 1000.0)
+    if isinstance(result, (list, tuple, dict, set)):
+        return min(1.0, len(result) / 100.0)
+    return min(1.0, sys.getsizeof(result) / 1000.0)
+
+
+# Governance results for return values that have no instance __dict__
+# (e.g. slotted classes); held weakly so results are not kept alive.
+_GOV_ATTACHMENTS: "weakref.WeakKeyDictionary[Any, StepResult]" = weakref.WeakKeyDictionary()
+
+
+def _attach_gov(result: Any, gov_result: StepResult) -> None:
+    """Attach gov_result to a governed call's return value where possible."""
+    cls = type(result)
+    try:
+        if cls.__dictoffset__:
+            result.__dict__["_gov"] = gov_result
+        elif cls.__weakrefoffset__:
+            _GOV_ATTACHMENTS[result] = gov_result
+    except TypeError:
+        # Read-only __dict__ (classes) or unhashable weakrefable objects
+        pass
+
+
+def get_gov(result: Any) -> Optional[StepResult]:
+    """
+    Return the StepResult attached to a governed call's return value.
+    
+    Works for plain objects (stored as result._gov) and for slotted objects
+    that support weak references. Returns None for values that cannot carry
+    an attachment, such as str, int or None.
+    """
+    gov = getattr(result, "_gov", None)
+    if gov is not None:
+        return gov
+    try:
+        return _GOV_ATTACHMENTS.get(result)
+    except TypeError:
+        return None
+
+
 class GovernedDecorator:
     """
     Automates signal extraction by wrapping tool or agent calls.
@@ -24,7 +77,7 @@ class GovernedDecorator:
     def __call__(self, func: Callable) -> Callable:
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            start_time = time.monotonic()
+            start_ns = time.perf_counter_ns()
             result = None
             error = None
             status = 'success'
@@ -35,16 +88,17 @@ class GovernedDecorator:
                 error = str(e)
                 status = 'error'
             
-            elapsed = time.monotonic() - start_time
+            # Integer nanoseconds until the single conversion to seconds
+            elapsed = (time.perf_counter_ns() - start_ns) * 1e-9
             
             # Simple automatic observation
-            # We use repr(result) length as a crude proxy for env_state_change
+            # We use the result's size as a crude proxy for env_state_change
             # This can be overridden by the user.
             obs = Observation(
                 action=func.__name__,
                 result=status,
                 elapsed_time=elapsed,
-                env_state_delta=min(1.0, len(str(result)) / 1000.0) if result else 0.0,
+                env_state_delta=_size_proxy(result),
                 agent_state_delta=0.1, # Conservative default
                 error=error
             )
@@ -55,8 +109,7 @@ class GovernedDecorator:
             # If governance halted, we might want to raise here or just return result
             # but usually, the loop should handle it.
             # We attach the gov_result to the function return for introspection.
-            if hasattr(result, '__dict__'):
-                result._gov = gov_result
+            _attach_gov(result, gov_result)
                 
             if error:
                 raise Exception(f"Governance Check: {gov_result.mode.name} | Original Error: {error}")
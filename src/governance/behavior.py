@@ -21,7 +21,7 @@ from dataclasses import dataclass
 from typing import Dict, Any
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BehaviorBudget:
     """
     Immutable budget representing behavioral permission.
@@ -113,7 +113,8 @@ def contract(name: str, enabled_check: Callable[[], bool] = contracts_enabled):
         @wraps(func)
         def wrapper(*args, **kwargs) -> bool:
             result = func(*args, **kwargs)
-            if enabled_check() and not result:
+            # Passing checks skip the enablement lookup entirely
+            if not result and enabled_check():
                 raise ContractViolation(
                     contract_name=name,
                     message=f"Contract {name} failed: {func.__doc__ or 'no description'}",
@@ -128,11 +129,20 @@ def contract(name: str, enabled_check: Callable[[], bool] = contracts_enabled):
 # Contract Enforcer
 # =============================================================================
 
+def _noop(*args: Any, **kwargs: Any) -> None:
+    """Stand-in for contract checks on a disabled enforcer."""
+    return None
+
+
 class ContractEnforcer:
     """
     Runtime contract enforcer for governance kernel.
     
     Checks critical invariants and raises ContractViolation on breach.
+    
+    Enablement is fixed at construction. A disabled enforcer rebinds its
+    check methods to a no-op, so callers on the per-step path pay only for
+    an empty call.
     """
     
     def __init__(self, enabled: Optional[bool] = None):
@@ -143,6 +153,11 @@ class ContractEnforcer:
             enabled: Override for contract checking (uses env var if None)
         """
         self._enabled = enabled if enabled is not None else contracts_enabled()
+        
+        if not self._enabled:
+            self.check_budget_monotonicity = _noop
+            self.check_halt_irreversibility = _noop
+            self.check_kernel_never_invokes = _noop
     
     @property
     def enabled(self) -> bool:
@@ -171,9 +186,6 @@ class ContractEnforcer:
         Raises:
             BudgetIncreasedError: If budget increased outside of recovery
         """
-        if not self._enabled:
-            return
-        
         # Risk should NEVER increase (even during recovery)
         if curr_budget.risk > prev_budget.risk + 1e-9:
             raise BudgetIncreasedError("risk", prev_budget.risk, curr_budget.risk)
@@ -210,9 +222,6 @@ class ContractEnforcer:
         Raises:
             HaltReversedError: If halted state was reversed without reset
         """
-        if not self._enabled:
-            return
-        
         if was_halted and not is_halted and not reset_called:
             raise HaltReversedError()
     
@@ -237,9 +246,6 @@ class ContractEnforcer:
         Raises:
             KernelInvokedActionError: If kernel invoked an action
         """
-        if not self._enabled:
-            return
-        
         # The kernel should not have any action invocation methods
         # This check is primarily for documentation and audit purposes
         forbidden_attrs = ['execute', 'run_action', 'invoke', 'call_tool']
@@ -332,6 +338,10 @@ class ContractCheckedKernel:
 # Convenience Functions
 # =============================================================================
 
+# Enforcers hold no per-call state, so the convenience asserts share one.
+_STRICT_ENFORCER = ContractEnforcer(enabled=True)
+
+
 def assert_budget_not_increased(
     prev_budget: Any,
     curr_budget: Any,
@@ -345,9 +355,8 @@ def assert_budget_not_increased(
     if not contracts_enabled():
         return
     
-    enforcer = ContractEnforcer(enabled=True)
     try:
-        enforcer.check_budget_monotonicity(prev_budget, curr_budget, allow_recovery=False)
+        _STRICT_ENFORCER.check_budget_monotonicity(prev_budget, curr_budget, allow_recovery=False)
     except BudgetIncreasedError as e:
         if context:
             e.message = f"{context}: {e.message}"
@@ -363,5 +372,4 @@ def assert_halt_is_terminal(was_halted: bool, is_halted: bool) -> None:
     if not contracts_enabled():
         return
     
-    enforcer = ContractEnforcer(enabled=True)
-    enforcer.check_halt_irreversibility(was_halted, is_halted)
+    _STRICT_ENFORCER.check_halt_irreversibility(was_halted, is_halted)
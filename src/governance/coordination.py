@@ -27,9 +27,9 @@ import threading
 import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
 from enum import Enum
 from typing import Dict, List, Optional, Set, Callable, Any
+from governance._clock import utc_timestamp
 from governance.behavior import BehaviorBudget
 
 
@@ -319,7 +319,7 @@ class AgentRegistry:
         with self._lock:
             state = AgentState(
                 agent_id=agent_id,
-                registered_at=datetime.now(timezone.utc).isoformat(),
+                registered_at=utc_timestamp(),
                 parent_id=parent_id,
             )
             self._agents[agent_id] = state
@@ -348,7 +348,7 @@ class AgentRegistry:
         with self._lock:
             if agent_id in self._agents:
                 state = self._agents[agent_id]
-                state.last_step_at = datetime.now(timezone.utc).isoformat()
+                state.last_step_at = utc_timestamp()
                 state.step_count += 1
                 state.halted = halted
                 if budget:
@@ -81,6 +81,21 @@ class GovernanceKernel:
         self.evaluator = SignalEvaluator()
         self.budget_computer = BudgetComputer(profile)
 
+        # Profiles are immutable: snapshot the fields step() reads every call
+        # so the hot path binds them as locals instead of attribute lookups.
+        self._profile_limits = (
+            profile.progress_threshold,
+            profile.stagnation_window,
+            profile.recovery_delay,
+            profile.recovery_cap,
+            profile.recovery_rate,
+            profile.max_exploration,
+            profile.max_risk,
+            profile.exhaustion_threshold,
+            profile.stagnation_effort_floor,
+            profile.max_steps,
+        )
+
         self.step_count = 0
         self.no_progress_steps = 0
         self.last_step_time = time.monotonic()
@@ -148,6 +163,19 @@ class GovernanceKernel:
                 mode=Mode.HALTED,
             )
 
+        (
+            progress_threshold,
+            stagnation_window,
+            recovery_delay,
+            recovery_cap,
+            recovery_rate,
+            max_exploration,
+            max_risk,
+            exhaustion_threshold,
+            stagnation_effort_floor,
+            max_steps,
+        ) = self._profile_limits
+
         now = time.monotonic()
         dt = now - self.last_step_time
         self.last_step_time = now
@@ -164,7 +192,7 @@ class GovernanceKernel:
         #    Drift Protection: Filter micro-progress < threshold
         # --------------------------------------------------
         effective_reward = reward
-        if 0.0 < reward < self.profile.progress_threshold:
+        if 0.0 < reward < progress_threshold:
             effective_reward = 0.0
             
         if effective_reward <= 0.0:
@@ -172,7 +200,7 @@ class GovernanceKernel:
         else:
             self.no_progress_steps = 0
 
-        stagnating = self.no_progress_steps >= self.profile.stagnation_window
+        stagnating = self.no_progress_steps >= stagnation_window
 
         # --------------------------------------------------
         # 2. Signal Evaluation  Control state accumulation
@@ -254,17 +282,17 @@ class GovernanceKernel:
         # - Recovery affects effort and persistence only
         # - Risk and exploration must never increase during recovery
         # - Recovery is bounded by pre-failure stable budget
-        if mode == Mode.RECOVERING and dt >= self.profile.recovery_delay:
+        if mode == Mode.RECOVERING and dt >= recovery_delay:
             self.budget = BehaviorBudget(
                 effort=min(
                     self._stable_budget.effort,  # Bound by pre-failure level
-                    self.profile.recovery_cap,
-                    self.budget.effort + self.profile.recovery_rate * dt
+                    recovery_cap,
+                    self.budget.effort + recovery_rate * dt
                 ),
                 persistence=min(
                     self._stable_budget.persistence,  # Bound by pre-failure level
-                    self.profile.recovery_cap,
-                    self.budget.persistence + self.profile.recovery_rate * dt
+                    recovery_cap,
+                    self.budget.persistence + recovery_rate * dt
                 ),
                 risk=self.budget.risk,  # Already frozen above
                 exploration=self.budget.exploration,
@@ -286,27 +314,27 @@ class GovernanceKernel:
         # --------------------------------------------------
         # 9. Failure checks (ordered, terminal)
         # --------------------------------------------------
-        if self.budget.exploration >= self.profile.max_exploration:
+        if self.budget.exploration >= max_exploration:
             halted = True
             failure = FailureType.SAFETY
             reason = "exploration_exceeded"
 
-        elif self.budget.risk >= self.profile.max_risk:
+        elif self.budget.risk >= max_risk:
             halted = True
             failure = FailureType.OVERRISK
             reason = "risk_exceeded"
 
-        elif self.budget.effort <= self.profile.exhaustion_threshold:
+        elif self.budget.effort <= exhaustion_threshold:
             halted = True
             failure = FailureType.EXHAUSTION
             reason = "exhaustion"
 
-        elif stagnating and self.budget.effort <= self.profile.stagnation_effort_floor:
+        elif stagnating and self.budget.effort <= stagnation_effort_floor:
             halted = True
             failure = FailureType.STAGNATION
             reason = "stagnation"
 
-        elif self.step_count >= self.profile.max_steps:
+        elif self.step_count >= max_steps:
             # EXTERNAL failure semantics:
             # --------------------------
             # This is a SAFETY FUSE, not governance regulation.
@@ -17,10 +17,58 @@ Usage:
     sink.record(step=1, effort=0.85, risk=0.1, halted=False)
 """
 
+import atexit
 import json
+import math
 import os
-from datetime import datetime, timezone
-from typing import Optional, Any, Dict
+import time
+import weakref
+from typing import IO, Optional, Any, Dict
+
+from governance._clock import utc_timestamp
+from governance.modes import mode_name
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _all_finite(obj: Any) -> bool:
+    """False if obj holds a NaN or infinite float, at any depth."""
+    if isinstance(obj, float):
+        return math.isfinite(obj)
+    if isinstance(obj, dict):
+        return all(_all_finite(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return all(_all_finite(v) for v in obj)
+    return True
+
+
+def _dumps_line(entry: Dict[str, Any]) -> bytes:
+    """
+    Serialize entry as one compact JSON line, using orjson when installed.
+    
+    orjson writes NaN and Infinity as null; entries holding them take the
+    stdlib path so the file is the same with or without orjson.
+    """
+    if ORJSON_AVAILABLE and _all_finite(entry):
+        try:
+            return orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+        except orjson.JSONEncodeError:
+            pass  # Fall back; the stdlib raises if it cannot encode either
+    return (json.dumps(entry, separators=(',', ':')) + '\n').encode('utf-8')
+
+
+# Sinks with an open file; any still open are flushed and closed at exit.
+_OPEN_SINKS: "weakref.WeakSet[LocalMetricsSink]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_sinks() -> None:
+    for sink in list(_OPEN_SINKS):
+        sink.close()
 
 
 class LocalMetricsSink:
@@ -37,15 +85,34 @@ class LocalMetricsSink:
     sink is working, failing, or disabled entirely.
     """
     
-    def __init__(self, filepath: str = "metrics.jsonl"):
+    def __init__(
+        self,
+        filepath: str = "metrics.jsonl",
+        flush_every: int = 1,
+        flush_interval: Optional[float] = None,
+    ):
         """
         Initialize the local metrics sink.
         
+        The file is opened on the first record and kept open, so each record
+        is a buffered write rather than an open/write/close.
+        
         Args:
             filepath: Path to JSONL file for metrics storage
+            flush_every: Flush to the OS every N records (default 1). Larger
+                values batch writes; call flush() or close() before reading
+                the file back. Open sinks are closed at interpreter exit.
+            flush_interval: Also flush when this many seconds have passed
+                since the last flush (checked on record, no timer thread),
+                bounding how stale the file can get under flush_every.
         """
         self._filepath = filepath
         self._enabled = True
+        self._flush_every = max(1, flush_every)
+        self._flush_interval = flush_interval
+        self._last_flush = time.monotonic()
+        self._pending = 0
+        self._fh: Optional[IO[bytes]] = None
     
     def record(
         self,
@@ -55,6 +122,7 @@ class LocalMetricsSink:
         halted: bool = False,
         halt_reason: Optional[str] = None,
         extra: Optional[Dict[str, Any]] = None,
+        timestamp_ns: Optional[int] = None,
     ) -> bool:
         """
         Record a metrics snapshot to the local file.
@@ -69,6 +137,7 @@ class LocalMetricsSink:
             halted: Whether the kernel is halted
             halt_reason: Reason for halt (if halted)
             extra: Optional additional fields
+            timestamp_ns: Step time from time.time_ns() (default: now)
             
         Returns:
             True if write succeeded, False otherwise
@@ -79,7 +148,7 @@ class LocalMetricsSink:
         try:
             # Build metrics entry
             entry = {
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": utc_timestamp(timestamp_ns),
                 "step": step,
                 "effort_remaining": effort_remaining,
                 "risk_level": risk_level,
@@ -92,13 +161,7 @@ class LocalMetricsSink:
             if extra:
                 entry.update(extra)
             
-            # Serialize to JSON
-            line = json.dumps(entry, separators=(',', ':'))
-            
-            # Append to file (non-blocking, best-effort)
-            with open(self._filepath, 'a', encoding='utf-8') as f:
-                f.write(line + '\n')
-            
+            self._write_line(_dumps_line(entry))
             return True
             
         except Exception:
@@ -106,34 +169,101 @@ class LocalMetricsSink:
             # Metrics are optional observers, not dependencies
             return False
     
-    def record_from_result(self, result: Any, step: int = 0) -> bool:
+    def _write_line(self, line: bytes) -> None:
+        """Append one serialized record, flushing per flush_every/flush_interval."""
+        fh = self._fh
+        if fh is None:
+            fh = self._fh = open(self._filepath, 'ab', buffering=1 << 16)
+            _OPEN_SINKS.add(self)
+        fh.write(line)
+        self._pending += 1
+        if self._pending >= self._flush_every or (
+            self._flush_interval is not None
+            and time.monotonic() - self._last_flush >= self._flush_interval
+        ):
+            self._pending = 0
+            self._last_flush = time.monotonic()
+            fh.flush()
+    
+    def record_from_result(
+        self,
+        result: Any,
+        step: int = 0,
+        timestamp_ns: Optional[int] = None,
+    ) -> bool:
         """
         Record metrics from an EngineResult.
         
+        Writes the same line as record() with the budget, halt and mode
+        fields filled in, building the entry directly from the result.
+        
         Args:
             result: EngineResult from kernel.step()
             step: Current step number
+            timestamp_ns: Step time from time.time_ns() (default: now)
             
         Returns:
             True if write succeeded, False otherwise
         """
+        if not self._enabled:
+            return False
+        
         try:
-            return self.record(
-                step=step,
-                effort_remaining=result.budget.effort,
-                risk_level=result.budget.risk,
-                halted=result.halted,
-                halt_reason=result.reason if result.halted else None,
-                extra={
-                    "exploration": result.budget.exploration,
-                    "persistence": result.budget.persistence,
-                    "mode": result.mode.name if hasattr(result.mode, 'name') else str(result.mode),
-                }
-            )
+            budget = result.budget
+            halted = result.halted
+            entry = {
+                "timestamp": utc_timestamp(timestamp_ns),
+                "step": step,
+                "effort_remaining": budget.effort,
+                "risk_level": budget.risk,
+                "halted": halted,
+            }
+            if halted and result.reason:
+                entry["halt_reason"] = result.reason
+            entry["exploration"] = budget.exploration
+            entry["persistence"] = budget.persistence
+            entry["mode"] = mode_name(result.mode)
+            
+            self._write_line(_dumps_line(entry))
+            return True
         except Exception:
             # CRITICAL: Never propagate exceptions
             return False
     
+    def flush(self) -> bool:
+        """
+        Flush buffered records to the file.
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            self._pending = 0
+            self._last_flush = time.monotonic()
+            if self._fh is not None:
+                self._fh.flush()
+            return True
+        except Exception:
+            return False
+    
+    def close(self) -> bool:
+        """
+        Flush and close the file handle. Recording again reopens it.
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        fh, self._fh = self._fh, None
+        self._pending = 0
+        _OPEN_SINKS.discard(self)
+        if fh is None:
+            return True
+        try:
+            fh.close()
+            return True
+        except Exception:
+            return False
+    
     def disable(self) -> None:
         """Disable metrics recording."""
         self._enabled = False
@@ -154,6 +284,7 @@ class LocalMetricsSink:
         Returns:
             True if successful, False otherwise
         """
+        self.close()
         try:
             if os.path.exists(self._filepath):
                 os.remove(self._filepath)
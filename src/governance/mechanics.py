@@ -33,6 +33,7 @@ from dataclasses import dataclass
 from typing import Optional
 from governance.behavior import BehaviorBudget
 from governance.state import ControlState
+from governance._kernel_jit import governance_math
 
 
 class GovernanceEngine:
@@ -85,9 +86,36 @@ class GovernanceEngine:
         [3.0, 0.0, 0.0, 0.0],  # risk suppresses effort
     ])
 
+    # Columns of W and V as plain float tuples for the scalar kernel
+    _W_COLS = tuple(tuple(float(x) for x in col) for col in W.T)
+    _V_COLS = tuple(tuple(float(x) for x in col) for col in V.T)
+
     def __init__(self, profile=None):
         self.profile = profile
 
+        # Profiles are immutable: resolve scaling and decay constants once
+        if profile:
+            self._stagnation_scales = (
+                profile.stagnation_effort_scale,
+                profile.stagnation_persistence_scale,
+            )
+            self._scales = (
+                profile.effort_scale,
+                profile.risk_scale,
+                profile.exploration_scale,
+                profile.persistence_scale,
+            )
+            self._decay = (
+                profile.exploration_decay,
+                profile.time_exploration_decay,
+                profile.persistence_decay,
+                profile.time_persistence_decay,
+            )
+        else:
+            self._stagnation_scales = (1.0, 1.0)
+            self._scales = (1.0, 1.0, 1.0, 1.0)
+            self._decay = (0.0, 0.0, 0.0, 0.0)
+
     def compute(self, state: ControlState, stagnating: bool = False, dt: float = 0.0) -> BehaviorBudget:
         """
         Compute behavioral budget from control state.
@@ -104,43 +132,33 @@ class GovernanceEngine:
         - Pure function (no side effects)
         - Deterministic (same inputs  same outputs)
         """
-        s = np.array([
+        # 1. Stagnation scaling (effort and persistence only)
+        stag_effort, stag_pers = self._stagnation_scales if stagnating else (1.0, 1.0)
+
+        # 3. Decay (Time + Step); zero without a profile
+        expl_decay, time_expl_decay, pers_decay, time_pers_decay = self._decay
+        decay_expl = expl_decay + dt * time_expl_decay
+        decay_pers = pers_decay + dt * time_pers_decay
+
+        # g = W.T @ s - V.T @ s, scaled, decayed and clipped to [0, 1]
+        effort, risk, exploration, persistence = governance_math(
             state.control_margin,
             state.control_loss,
             state.exploration_pressure,
             state.urgency_level,
             state.risk,
-        ])
-
-        g = self.W.T @ s - self.V.T @ s
-
-        # 1. Stagnation Scaling
-        # Applied to effort (index 0) and persistence (index 3)
-        if stagnating and self.profile:
-            g[0] *= self.profile.stagnation_effort_scale
-            g[3] *= self.profile.stagnation_persistence_scale
-
-        # 2. Profile Scaling
-        if self.profile:
-            g[0] *= self.profile.effort_scale
-            g[1] *= self.profile.risk_scale
-            g[2] *= self.profile.exploration_scale
-            g[3] *= self.profile.persistence_scale
-
-        # 3. Decay (Time + Step)
-        if self.profile:
-            decay_expl = self.profile.exploration_decay + dt * self.profile.time_exploration_decay
-            decay_pers = self.profile.persistence_decay + dt * self.profile.time_persistence_decay
-            
-            g[2] -= decay_expl
-            g[3] -= decay_pers
-
-        # 4. Clip to valid range
-        g = np.clip(g, 0.0, 1.0)
+            self._W_COLS,
+            self._V_COLS,
+            stag_effort,
+            stag_pers,
+            *self._scales,
+            decay_expl,
+            decay_pers,
+        )
 
         return BehaviorBudget(
-            effort=float(g[0]),
-            risk=float(g[1]),
-            exploration=float(g[2]),
-            persistence=float(g[3]),
+            effort=effort,
+            risk=risk,
+            exploration=exploration,
+            persistence=persistence,
         )
@@ -22,23 +22,59 @@ Usage:
     # Export
     print(registry.to_prometheus_text())
 """
+import bisect
 import json
-from dataclasses import dataclass, asdict, field
-from datetime import datetime, timezone
-from typing import List, Callable, Optional, Dict, Any
-from collections import defaultdict
+import math
+from dataclasses import dataclass, field
+
+import numpy as np
 
 try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+from typing import Deque, List, Callable, Optional, Dict, Any
+from collections import deque
+from operator import attrgetter, itemgetter
+
+try:
+    from governance._clock import utc_timestamp
+    from governance.modes import mode_name
     from governance.result import EngineResult
     from governance.signals import Signals
 except ImportError:
     import os
     import sys
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from governance._clock import utc_timestamp
+    from governance.modes import mode_name
     from governance.result import EngineResult
     from governance.signals import Signals
 
 
+def _dumps_bytes(obj: Dict[str, Any]) -> bytes:
+    """
+    JSON-encode a flat dict to UTF-8, using orjson when installed (compact).
+    
+    orjson writes NaN and Infinity as null; dicts holding them take the
+    stdlib path so output is the same with or without orjson.
+    """
+    if ORJSON_AVAILABLE and all(
+        math.isfinite(v) for v in obj.values() if isinstance(v, float)
+    ):
+        try:
+            return orjson.dumps(obj)
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers wider than 64 bits; the stdlib handles them
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def _dumps(obj: Dict[str, Any]) -> str:
+    """JSON-encode a flat dict, using orjson when installed (compact output)."""
+    return _dumps_bytes(obj).decode('utf-8')
+
+
 @dataclass(frozen=True)
 class GovernanceMetrics:
     """
@@ -79,17 +115,74 @@ class GovernanceMetrics:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
-        return asdict(self)
+        # Explicit literal: every field is a scalar, so asdict's field
+        # reflection and deep copy buy nothing. Keep in field order.
+        return {
+            "timestamp": self.timestamp,
+            "step": self.step,
+            "effort": self.effort,
+            "risk": self.risk,
+            "exploration": self.exploration,
+            "persistence": self.persistence,
+            "control_margin": self.control_margin,
+            "control_loss": self.control_loss,
+            "exploration_pressure": self.exploration_pressure,
+            "urgency_level": self.urgency_level,
+            "state_risk": self.state_risk,
+            "reward": self.reward,
+            "novelty": self.novelty,
+            "urgency": self.urgency,
+            "difficulty": self.difficulty,
+            "trust": self.trust,
+            "mode": self.mode,
+            "halted": self.halted,
+            "failure_type": self.failure_type,
+            "failure_reason": self.failure_reason,
+        }
     
     def to_json(self) -> str:
         """Convert to JSON string."""
-        return json.dumps(self.to_dict())
+        return _dumps(self.to_dict())
+    
+    def to_json_bytes(self) -> bytes:
+        """Convert to UTF-8 encoded JSON."""
+        return _dumps_bytes(self.to_dict())
 
 
 # =============================================================================
 # Prometheus-Style Metrics (V1 Hardening)
 # =============================================================================
 
+# Exposition line formats, applied with bytes % so lines are built as bytes.
+# Counter values are written as str(value), which the text format has always
+# used; %r would differ for non-float numbers such as NumPy scalars.
+_COUNTER_LINE_FMT = b"%s %s"
+_COUNTER_LABELED_LINE_FMT = b"%s{%s} %s"
+_GAUGE_LINE_FMT = b"%s %.4f"
+
+# Halt reasons produced by GovernanceKernel.step(); their halts_by_reason
+# series keys are registered up front.
+_KERNEL_HALT_REASONS = (
+    "exploration_exceeded",
+    "risk_exceeded",
+    "exhaustion",
+    "stagnation",
+    "max_steps",
+)
+
+# Scrape buffers larger than this are dropped after export instead of being
+# kept for reuse, so one oversized scrape does not pin its memory.
+_SCRAPE_BUF_SOFT_MAX = 128 * 1024
+
+
+def _label_key(labels: Dict[str, str]) -> str:
+    """Flat dict key for a label set; single-label sets skip the sort."""
+    if len(labels) == 1:
+        (k, v), = labels.items()
+        return f"{k}={v}"
+    return "\x1f".join(f"{k}={v}" for k, v in sorted(labels.items()))
+
+
 class Counter:
     """
     Prometheus-style counter that only increases.
@@ -98,39 +191,81 @@ class Counter:
         self.name = name
         self.help_text = help_text
         self.labels = labels or []
-        self._values: Dict[tuple, float] = defaultdict(float)
+        self._values: Dict[str, float] = {}
         self._total = 0.0
+        # Encoded once; exposition only appends the value lines
+        self._name_b = name.encode('utf-8')
+        self._labels_b: Dict[str, bytes] = {}
+        # Sorted label items per key, and registered keys kept in that
+        # order so exposition never has to sort
+        self._label_items: Dict[str, tuple] = {}
+        self._ordered_keys: List[str] = []
+        self._header_b = (
+            f"# HELP {name} {help_text}\n# TYPE {name} counter\n".encode('utf-8')
+        )
+    
+    def series_key(self, labels: Dict[str, str]) -> str:
+        """
+        Register a label set and return its series key for inc_key().
+        
+        Registering alone does not create a series; it only shows up in
+        exposition once incremented.
+        """
+        key = _label_key(labels)
+        if key not in self._labels_b:
+            items = tuple(sorted(labels.items()))
+            self._label_items[key] = items
+            self._labels_b[key] = ",".join(
+                f'{k}="{v}"' for k, v in items
+            ).encode('utf-8')
+            bisect.insort(self._ordered_keys, key, key=self._label_items.__getitem__)
+        return key
+    
+    def inc_key(self, key: str, value: float = 1.0) -> None:
+        """Increment the series for a key returned by series_key()."""
+        values = self._values
+        values[key] = values.get(key, 0.0) + value
     
     def inc(self, value: float = 1.0, labels: Optional[Dict[str, str]] = None) -> None:
         """Increment the counter."""
         if labels:
-            key = tuple(sorted(labels.items()))
-            self._values[key] += value
+            key = self.series_key(labels)
+            values = self._values
+            values[key] = values.get(key, 0.0) + value
         else:
             self._total += value
     
     def get(self, labels: Optional[Dict[str, str]] = None) -> float:
         """Get current value."""
         if labels:
-            key = tuple(sorted(labels.items()))
-            return self._values[key]
+            return self._values.get(_label_key(labels), 0.0)
         return self._total
     
-    def to_prometheus(self) -> str:
-        """Export in Prometheus text format."""
-        lines = [
-            f"# HELP {self.name} {self.help_text}",
-            f"# TYPE {self.name} counter",
-        ]
+    def write_prometheus(self, buf: bytearray) -> None:
+        """Append Prometheus text format to buf (no trailing newline)."""
+        buf += self._header_b
         
-        if self._values:
-            for key, value in sorted(self._values.items()):
-                label_str = ",".join(f'{k}="{v}"' for k, v in key)
-                lines.append(f"{self.name}{{{label_str}}} {value}")
+        values = self._values
+        if values:
+            sep = b""
+            labels_b = self._labels_b
+            for key in self._ordered_keys:
+                value = values.get(key)
+                if value is None:
+                    continue  # registered but never incremented
+                buf += sep
+                buf += _COUNTER_LABELED_LINE_FMT % (
+                    self._name_b, labels_b[key], str(value).encode('ascii')
+                )
+                sep = b"\n"
         else:
-            lines.append(f"{self.name} {self._total}")
-        
-        return "\n".join(lines)
+            buf += _COUNTER_LINE_FMT % (self._name_b, str(self._total).encode('ascii'))
+    
+    def to_prometheus(self) -> str:
+        """Export in Prometheus text format."""
+        buf = bytearray()
+        self.write_prometheus(buf)
+        return buf.decode('utf-8')
 
 
 class Gauge:
@@ -141,6 +276,10 @@ class Gauge:
         self.name = name
         self.help_text = help_text
         self._value = 0.0
+        self._name_b = name.encode('utf-8')
+        self._header_b = (
+            f"# HELP {name} {help_text}\n# TYPE {name} gauge\n".encode('utf-8')
+        )
     
     def set(self, value: float) -> None:
         """Set the gauge value."""
@@ -158,13 +297,16 @@ class Gauge:
         """Get current value."""
         return self._value
     
+    def write_prometheus(self, buf: bytearray) -> None:
+        """Append Prometheus text format to buf (no trailing newline)."""
+        buf += self._header_b
+        buf += _GAUGE_LINE_FMT % (self._name_b, self._value)
+    
     def to_prometheus(self) -> str:
         """Export in Prometheus text format."""
-        return "\n".join([
-            f"# HELP {self.name} {self.help_text}",
-            f"# TYPE {self.name} gauge",
-            f"{self.name} {self._value:.4f}",
-        ])
+        buf = bytearray()
+        self.write_prometheus(buf)
+        return buf.decode('utf-8')
 
 
 class PrometheusRegistry:
@@ -223,6 +365,11 @@ class PrometheusRegistry:
         
         # Internal tracking
         self._previous_effort = 1.0
+        self._scratch = bytearray()
+        self._halt_keys: Dict[str, str] = {
+            reason: self.halts_by_reason.series_key({"reason": reason})
+            for reason in _KERNEL_HALT_REASONS
+        }
         self._all_metrics = [
             self.steps_total,
             self.halts_by_reason,
@@ -247,7 +394,7 @@ class PrometheusRegistry:
         
         # Record halt if applicable
         if result.halted and result.reason:
-            self.halts_by_reason.inc(labels={"reason": result.reason})
+            self.halts_by_reason.inc_key(self._halt_key(result.reason))
         
         # Update budget gauges
         self.budget_effort.set(result.budget.effort)
@@ -263,10 +410,79 @@ class PrometheusRegistry:
         # Update halted state
         self.halted.set(1.0 if result.halted else 0.0)
     
+    def _halt_key(self, reason: str) -> str:
+        """halts_by_reason series key for a reason, registering new ones."""
+        key = self._halt_keys.get(reason)
+        if key is None:
+            key = self._halt_keys[reason] = self.halts_by_reason.series_key({"reason": reason})
+        return key
+    
+    def record_batch(self, results: List[EngineResult]) -> None:
+        """
+        Record metrics for several kernel step results at once.
+        
+        Leaves the registry in the same state as calling record_step() on
+        each result in order, but touches each metric once per batch.
+        
+        Args:
+            results: EngineResults from consecutive kernel.step() calls
+        """
+        if not results:
+            return
+        
+        self.steps_total.inc(len(results))
+        
+        halts: Dict[str, int] = {}
+        for result in results:
+            if result.halted and result.reason:
+                halts[result.reason] = halts.get(result.reason, 0) + 1
+        for reason, count in halts.items():
+            self.halts_by_reason.inc_key(self._halt_key(reason), count)
+        
+        last = results[-1]
+        budget = last.budget
+        self.budget_effort.set(budget.effort)
+        self.budget_risk.set(budget.risk)
+        self.budget_exploration.set(budget.exploration)
+        self.budget_persistence.set(budget.persistence)
+        
+        # Drain rate is the last step's drop, as with per-step recording
+        previous = results[-2].budget.effort if len(results) > 1 else self._previous_effort
+        self.effort_drain_rate.set(max(0.0, previous - budget.effort))
+        self._previous_effort = budget.effort
+        
+        self.halted.set(1.0 if last.halted else 0.0)
+    
     def record_audit_entry(self) -> None:
         """Record that an audit entry was written."""
         self.audit_entries_written.inc()
     
+    def _fill_scratch(self) -> bytearray:
+        """Render every metric into the reusable scrape buffer."""
+        buf = self._scratch
+        buf.clear()
+        sep = b""
+        for metric in self._all_metrics:
+            buf += sep
+            metric.write_prometheus(buf)
+            sep = b"\n\n"
+        return buf
+    
+    def _release_scratch(self) -> None:
+        """Drop the scrape buffer if it has grown past the soft limit."""
+        if len(self._scratch) > _SCRAPE_BUF_SOFT_MAX:
+            self._scratch = bytearray()
+    
+    def to_prometheus_bytes(self) -> bytes:
+        """
+        Export all metrics in Prometheus text format as UTF-8 bytes.
+        
+        Suitable for writing straight to an HTTP response body.
+        """
+        body = bytes(self._fill_scratch())
+        self._release_scratch()
+        return body
+    
     def to_prometheus_text(self) -> str:
         """
         Export all metrics in Prometheus text format.
@@ -274,8 +490,56 @@ class PrometheusRegistry:
         Returns:
             Complete Prometheus metrics text
         """
-        sections = [m.to_prometheus() for m in self._all_metrics]
-        return "\n\n".join(sections)
+        text = self._fill_scratch().decode('utf-8')
+        self._release_scratch()
+        return text
+
+
+# Static HELP/TYPE lines of MetricsCollector.to_prometheus(); only the
+# values are formatted per export.
+_COLLECTOR_PROM_TEMPLATE = "\n".join([
+    "# HELP governance_budget_effort Current effort budget [0,1]",
+    "# TYPE governance_budget_effort gauge",
+    "governance_budget_effort %.4f",
+    "",
+    "# HELP governance_budget_risk Current risk budget [0,1]",
+    "# TYPE governance_budget_risk gauge",
+    "governance_budget_risk %.4f",
+    "",
+    "# HELP governance_budget_exploration Current exploration budget [0,1]",
+    "# TYPE governance_budget_exploration gauge",
+    "governance_budget_exploration %.4f",
+    "",
+    "# HELP governance_budget_persistence Current persistence budget [0,1]",
+    "# TYPE governance_budget_persistence gauge",
+    "governance_budget_persistence %.4f",
+    "",
+    "# HELP governance_control_margin Internal control margin",
+    "# TYPE governance_control_margin gauge",
+    "governance_control_margin %.4f",
+    "",
+    "# HELP governance_control_loss Accumulated control loss (frustration)",
+    "# TYPE governance_control_loss gauge",
+    "governance_control_loss %.4f",
+    "",
+    "# HELP governance_step_count Total steps executed",
+    "# TYPE governance_step_count counter",
+    "governance_step_count %d",
+    "",
+    "# HELP governance_halted Whether the kernel is halted (0/1)",
+    "# TYPE governance_halted gauge",
+    "governance_halted %d",
+])
+
+# Control state fields read by MetricsCollector.record(); result.state may be
+# a ControlState or its dict snapshot, so one getter per form is prebuilt.
+_STATE_FIELDS = ("control_margin", "control_loss", "exploration_pressure", "urgency_level", "risk")
+_STATE_FROM_DICT = itemgetter(*_STATE_FIELDS)
+_STATE_FROM_ATTRS = attrgetter(*_STATE_FIELDS)
+
+# Fields aggregated by MetricsCollector.summary(), one row each in its buffer
+_SUMMARY_FIELDS = ("effort", "risk", "control_loss")
+_SUMMARY_INITIAL_CAPACITY = 1024
 
 
 class MetricsCollector:
@@ -286,10 +550,28 @@ class MetricsCollector:
     - Records metrics from EngineResult + Signals
     - Supports hooks for real-time streaming
     - Exports to Prometheus and JSONL formats
+    
+    History is a bounded window of the most recent snapshots; hooks see
+    every snapshot, so stream through a hook to keep a complete record.
     """
     
-    def __init__(self):
-        self._history: List[GovernanceMetrics] = []
+    def __init__(self, max_history: Optional[int] = 10_000):
+        """
+        Args:
+            max_history: Number of recent snapshots kept for history,
+                summary() and exports (None = unbounded)
+        """
+        if max_history is not None and max_history < 1:
+            raise ValueError("max_history must be >= 1 or None")
+        self._history: Deque[GovernanceMetrics] = deque(maxlen=max_history)
+        # Struct-of-arrays copy of the summary fields for the same window:
+        # grows by doubling, then acts as a ring once max_history is reached.
+        self._max_history = max_history
+        capacity = _SUMMARY_INITIAL_CAPACITY
+        if max_history is not None:
+            capacity = min(capacity, max_history)
+        self._summary_buf = np.empty((len(_SUMMARY_FIELDS), capacity))
+        self._summary_count = 0
         self._hooks: List[Callable[[GovernanceMetrics], None]] = []
         self._step_count = 0
     
@@ -316,6 +598,7 @@ class MetricsCollector:
         urgency: float = 0.0,
         difficulty: float = 0.0,
         trust: float = 1.0,
+        timestamp_ns: Optional[int] = None,
     ) -> GovernanceMetrics:
         """
         Record metrics from a kernel step result.
@@ -324,6 +607,8 @@ class MetricsCollector:
             result: The EngineResult from kernel.step()
             signals: Optional Signals object (if using observe())
             reward/novelty/urgency/difficulty/trust: Direct signal values
+            timestamp_ns: Step time from time.time_ns(); pass the same value
+                to every sink recording this step (default: now)
             
         Returns:
             The recorded GovernanceMetrics snapshot
@@ -338,21 +623,26 @@ class MetricsCollector:
             difficulty = getattr(signals, 'difficulty', 0.0)
             trust = getattr(signals, 'trust', 1.0)
         
+        # Control state (handle both dict and object), type checked once
+        state = result.state
+        get_state = _STATE_FROM_DICT if isinstance(state, dict) else _STATE_FROM_ATTRS
+        control_margin, control_loss, exploration_pressure, urgency_level, state_risk = get_state(state)
+        
         # Build metrics snapshot
         metrics = GovernanceMetrics(
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=utc_timestamp(timestamp_ns),
             step=self._step_count,
             # Budget
             effort=result.budget.effort,
             risk=result.budget.risk,
             exploration=result.budget.exploration,
             persistence=result.budget.persistence,
-            # Control State (handle both dict and object)
-            control_margin=result.state['control_margin'] if isinstance(result.state, dict) else result.state.control_margin,
-            control_loss=result.state['control_loss'] if isinstance(result.state, dict) else result.state.control_loss,
-            exploration_pressure=result.state['exploration_pressure'] if isinstance(result.state, dict) else result.state.exploration_pressure,
-            urgency_level=result.state['urgency_level'] if isinstance(result.state, dict) else result.state.urgency_level,
-            state_risk=result.state['risk'] if isinstance(result.state, dict) else result.state.risk,
+            # Control State
+            control_margin=control_margin,
+            control_loss=control_loss,
+            exploration_pressure=exploration_pressure,
+            urgency_level=urgency_level,
+            state_risk=state_risk,
             # Signals
             reward=reward,
             novelty=novelty,
@@ -360,13 +650,14 @@ class MetricsCollector:
             difficulty=difficulty,
             trust=trust,
             # Decision
-            mode=result.mode.name if hasattr(result.mode, 'name') else str(result.mode),
+            mode=mode_name(result.mode),
             halted=result.halted,
             failure_type=result.failure.name if result.failure and hasattr(result.failure, 'name') else None,
             failure_reason=result.reason,
         )
         
         self._history.append(metrics)
+        self._push_summary(metrics.effort, metrics.risk, metrics.control_loss)
         
         # Invoke hooks
         for hook in self._hooks:
@@ -377,9 +668,28 @@ class MetricsCollector:
         
         return metrics
     
+    def _push_summary(self, effort: float, risk: float, control_loss: float) -> None:
+        """Append one row of summary fields to the SoA buffer."""
+        buf = self._summary_buf
+        capacity = buf.shape[1]
+        n = self._summary_count
+        if n == capacity and (self._max_history is None or capacity < self._max_history):
+            new_capacity = capacity * 2
+            if self._max_history is not None:
+                new_capacity = min(new_capacity, self._max_history)
+            grown = np.empty((buf.shape[0], new_capacity))
+            grown[:, :capacity] = buf
+            buf = self._summary_buf = grown
+            capacity = new_capacity
+        col = n % capacity
+        buf[0, col] = effort
+        buf[1, col] = risk
+        buf[2, col] = control_loss
+        self._summary_count = n + 1
+    
     @property
     def history(self) -> List[GovernanceMetrics]:
-        """Get all recorded metrics."""
+        """Get the retained metrics snapshots, oldest first."""
         return list(self._history)
     
     @property
@@ -390,6 +700,7 @@ class MetricsCollector:
     def clear(self) -> None:
         """Clear all recorded metrics."""
         self._history.clear()
+        self._summary_count = 0
         self._step_count = 0
     
     def to_prometheus(self) -> str:
@@ -403,93 +714,73 @@ class MetricsCollector:
             return ""
         
         m = self._history[-1]
-        lines = [
-            "# HELP governance_budget_effort Current effort budget [0,1]",
-            "# TYPE governance_budget_effort gauge",
-            f"governance_budget_effort {m.effort:.4f}",
-            "",
-            "# HELP governance_budget_risk Current risk budget [0,1]",
-            "# TYPE governance_budget_risk gauge",
-            f"governance_budget_risk {m.risk:.4f}",
-            "",
-            "# HELP governance_budget_exploration Current exploration budget [0,1]",
-            "# TYPE governance_budget_exploration gauge",
-            f"governance_budget_exploration {m.exploration:.4f}",
-            "",
-            "# HELP governance_budget_persistence Current persistence budget [0,1]",
-            "# TYPE governance_budget_persistence gauge",
-            f"governance_budget_persistence {m.persistence:.4f}",
-            "",
-            "# HELP governance_control_margin Internal control margin",
-            "# TYPE governance_control_margin gauge",
-            f"governance_control_margin {m.control_margin:.4f}",
-            "",
-            "# HELP governance_control_loss Accumulated control loss (frustration)",
-            "# TYPE governance_control_loss gauge",
-            f"governance_control_loss {m.control_loss:.4f}",
-            "",
-            "# HELP governance_step_count Total steps executed",
-            "# TYPE governance_step_count counter",
-            f"governance_step_count {m.step}",
-            "",
-            "# HELP governance_halted Whether the kernel is halted (0/1)",
-            "# TYPE governance_halted gauge",
-            f"governance_halted {1 if m.halted else 0}",
-        ]
-        return "\n".join(lines)
+        return _COLLECTOR_PROM_TEMPLATE % (
+            m.effort, m.risk, m.exploration, m.persistence,
+            m.control_margin, m.control_loss, m.step, 1 if m.halted else 0,
+        )
     
-    def to_jsonl(self, filepath: Optional[str] = None) -> str:
+    def to_jsonl(self, filepath: Optional[str] = None) -> Optional[str]:
         """
         Export all metrics as JSON Lines.
         
         Args:
-            filepath: If provided, write to file. Otherwise return string.
+            filepath: If provided, stream lines to this file. Otherwise
+                return them as a string.
             
         Returns:
-            JSONL string if no filepath given
+            JSONL string if no filepath given, else None
         """
-        lines = [m.to_json() for m in self._history]
-        content = "\n".join(lines)
-        
-        if filepath:
-            with open(filepath, 'w') as f:
-                f.write(content)
+        if not filepath:
+            return "\n".join([m.to_json() for m in self._history])
         
-        return content
+        # Written line by line so the whole export is never held in memory
+        with open(filepath, 'wb', buffering=1 << 20) as f:
+            write = f.write
+            sep = b""
+            for m in self._history:
+                write(sep)
+                write(m.to_json_bytes())
+                sep = b"\n"
+        return None
     
     def summary(self) -> Dict[str, Any]:
         """
         Get a summary of collected metrics.
         
         Returns:
-            Dict with min/max/avg for key metrics
+            Dict with min/max/avg for key metrics over the retained history;
+            total_steps counts every recorded step
         """
         if not self._history:
             return {}
         
-        efforts = [m.effort for m in self._history]
-        risks = [m.risk for m in self._history]
-        losses = [m.control_loss for m in self._history]
+        # Window order does not matter for min/max/mean, so the ring buffer
+        # is reduced in place; final values come from the latest snapshot.
+        window = self._summary_buf[:, :min(self._summary_count, self._summary_buf.shape[1])]
+        mins = window.min(axis=1).tolist()
+        maxs = window.max(axis=1).tolist()
+        avgs = window.mean(axis=1).tolist()
+        latest = self._history[-1]
         
         return {
-            "total_steps": len(self._history),
-            "halted": self._history[-1].halted,
-            "final_mode": self._history[-1].mode,
+            "total_steps": self._step_count,
+            "halted": latest.halted,
+            "final_mode": latest.mode,
             "effort": {
-                "min": min(efforts),
-                "max": max(efforts),
-                "avg": sum(efforts) / len(efforts),
-                "final": efforts[-1],
+                "min": mins[0],
+                "max": maxs[0],
+                "avg": avgs[0],
+                "final": latest.effort,
             },
             "risk": {
-                "min": min(risks),
-                "max": max(risks),
-                "avg": sum(risks) / len(risks),
-                "final": risks[-1],
+                "min": mins[1],
+                "max": maxs[1],
+                "avg": avgs[1],
+                "final": latest.risk,
             },
             "control_loss": {
-                "min": min(losses),
-                "max": max(losses),
-                "final": losses[-1],
+                "min": mins[2],
+                "max": maxs[2],
+                "final": latest.control_loss,
             },
         }
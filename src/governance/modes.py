@@ -32,3 +32,12 @@ class Mode(Enum):
     IDLE = auto()
     RECOVERING = auto()
     HALTED = auto()
+
+
+_MODE_NAMES = {mode: mode.name for mode in Mode}
+
+
+def mode_name(mode) -> str:
+    """Name of a Mode, or str() of anything else passed in its place."""
+    name = _MODE_NAMES.get(mode)
+    return name if name is not None else str(mode)
@@ -28,7 +28,8 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import List, Optional, Dict, Any, Set
-from datetime import datetime, timezone
+
+from governance._clock import utc_timestamp
 
 
 class PolicyVerdict(Enum):
@@ -67,7 +68,7 @@ class PolicyContext:
     # Metadata
     session_id: Optional[str] = None
     agent_id: Optional[str] = None
-    timestamp: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    timestamp: str = field(default_factory=utc_timestamp)
 
 
 @dataclass(frozen=True)
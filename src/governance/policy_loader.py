@@ -18,14 +18,18 @@ Configuration Format:
     See config/policies.yaml for the complete schema.
 """
 
+import copy
 import os
+from functools import lru_cache
 from pathlib import Path
-from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from dataclasses import dataclass, fields, replace
+from typing import Any, Dict, Optional, Tuple
 
 try:
     import yaml
     YAML_AVAILABLE = True
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    _YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
 except ImportError:
     YAML_AVAILABLE = False
 
@@ -85,6 +89,68 @@ class PolicyConfig:
     persistence_scale: float = 1.0
 
 
+# (section, key, PolicyConfig attribute) for every YAML setting
+_SECTION_KEYS: Tuple[Tuple[str, str, str], ...] = (
+    ('limits', 'max_steps', 'max_steps'),
+    ('limits', 'max_effort', 'max_effort'),
+    ('limits', 'max_risk', 'max_risk'),
+    ('limits', 'max_exploration', 'max_exploration'),
+    ('limits', 'exhaustion_threshold', 'exhaustion_threshold'),
+    ('stagnation', 'window', 'stagnation_window'),
+    ('stagnation', 'effort_floor', 'stagnation_effort_floor'),
+    ('stagnation', 'effort_scale', 'stagnation_effort_scale'),
+    ('stagnation', 'persistence_scale', 'stagnation_persistence_scale'),
+    ('stagnation', 'progress_threshold', 'progress_threshold'),
+    ('recovery', 'rate', 'recovery_rate'),
+    ('recovery', 'cap', 'recovery_cap'),
+    ('recovery', 'delay', 'recovery_delay'),
+    ('decay', 'persistence', 'persistence_decay'),
+    ('decay', 'exploration', 'exploration_decay'),
+    ('decay', 'time_persistence', 'time_persistence_decay'),
+    ('decay', 'time_exploration', 'time_exploration_decay'),
+    ('scaling', 'effort', 'effort_scale'),
+    ('scaling', 'risk', 'risk_scale'),
+    ('scaling', 'exploration', 'exploration_scale'),
+    ('scaling', 'persistence', 'persistence_scale'),
+)
+# Same table with the PolicyConfig default for each attribute appended
+_POLICY_DEFAULTS = {f.name: f.default for f in fields(PolicyConfig)}
+_FIELD_MAP: Tuple[Tuple[str, str, str, Any], ...] = tuple(
+    (section, key, attr, _POLICY_DEFAULTS[attr]) for section, key, attr in _SECTION_KEYS
+)
+
+# PolicyConfig attributes carried over to Profile (max_effort has no counterpart)
+_PROFILE_FIELDS = tuple(f.name for f in fields(Profile) if f.name in _POLICY_DEFAULTS)
+
+
+def _parse_policy(config: Dict[str, Any]) -> PolicyConfig:
+    """Build a PolicyConfig from a parsed YAML document, filling in defaults."""
+    values = {}
+    for section, key, attr, default in _FIELD_MAP:
+        values[attr] = config.get(section, {}).get(key, default)
+    return PolicyConfig(**values)
+
+
+@lru_cache(maxsize=16)
+def _load_cached(path: str, mtime_ns: int, size: int) -> Tuple[Dict[str, Any], PolicyConfig]:
+    """
+    Parse a policy file once per (path, mtime, size).
+    
+    Editing the file changes its stat key, so reloads pick up new contents
+    while repeated loads of an unchanged file skip the YAML parse.
+    """
+    try:
+        with open(path, 'r') as f:
+            text = f.read()
+        config = yaml.load(text, Loader=_YamlLoader)
+    except FileNotFoundError:
+        raise PolicyLoadError(f"Policy file not found: {path}")
+    except yaml.YAMLError as e:
+        raise PolicyLoadError(f"Invalid YAML in {path}: {e}")
+    
+    return config, _parse_policy(config)
+
+
 class PolicyLoader:
     """
     Loads governance policies from YAML configuration.
@@ -122,54 +188,15 @@ class PolicyLoader:
         Raises:
             PolicyLoadError: If loading or parsing fails
         """
-        if not self.filepath.exists():
-            raise PolicyLoadError(f"Policy file not found: {self.filepath}")
-        
         try:
-            with open(self.filepath, 'r') as f:
-                self._config = yaml.safe_load(f)
-        except yaml.YAMLError as e:
-            raise PolicyLoadError(f"Invalid YAML in {self.filepath}: {e}")
-        
-        # Parse into PolicyConfig with defaults
-        limits = self._config.get('limits', {})
-        stagnation = self._config.get('stagnation', {})
-        recovery = self._config.get('recovery', {})
-        decay = self._config.get('decay', {})
-        scaling = self._config.get('scaling', {})
+            stat = self.filepath.stat()
+        except FileNotFoundError:
+            raise PolicyLoadError(f"Policy file not found: {self.filepath}")
         
-        self._policy = PolicyConfig(
-            # Limits
-            max_steps=limits.get('max_steps', 100),
-            max_effort=limits.get('max_effort', 1.0),
-            max_risk=limits.get('max_risk', 0.8),
-            max_exploration=limits.get('max_exploration', 0.9),
-            exhaustion_threshold=limits.get('exhaustion_threshold', 0.05),
-            
-            # Stagnation
-            stagnation_window=stagnation.get('window', 10),
-            stagnation_effort_floor=stagnation.get('effort_floor', 0.1),
-            stagnation_effort_scale=stagnation.get('effort_scale', 0.7),
-            stagnation_persistence_scale=stagnation.get('persistence_scale', 0.6),
-            progress_threshold=stagnation.get('progress_threshold', 0.05),
-            
-            # Recovery
-            recovery_rate=recovery.get('rate', 0.25),
-            recovery_cap=recovery.get('cap', 1.0),
-            recovery_delay=recovery.get('delay', 0.5),
-            
-            # Decay
-            persistence_decay=decay.get('persistence', 0.05),
-            exploration_decay=decay.get('exploration', 0.05),
-            time_persistence_decay=decay.get('time_persistence', 0.002),
-            time_exploration_decay=decay.get('time_exploration', 0.002),
-            
-            # Scaling
-            effort_scale=scaling.get('effort', 1.0),
-            risk_scale=scaling.get('risk', 1.0),
-            exploration_scale=scaling.get('exploration', 1.0),
-            persistence_scale=scaling.get('persistence', 1.0),
-        )
+        config, policy = _load_cached(str(self.filepath), stat.st_mtime_ns, stat.st_size)
+        # The cached objects are shared between loaders; hand out copies
+        self._config = copy.deepcopy(config)
+        self._policy = replace(policy)
         
         return self._policy
     
@@ -187,34 +214,9 @@ class PolicyLoader:
             self.load()
         
         policy = self._policy
-        
         return Profile(
             name=name,
-            # Scaling
-            effort_scale=policy.effort_scale,
-            risk_scale=policy.risk_scale,
-            exploration_scale=policy.exploration_scale,
-            persistence_scale=policy.persistence_scale,
-            # Recovery
-            recovery_rate=policy.recovery_rate,
-            recovery_cap=policy.recovery_cap,
-            recovery_delay=policy.recovery_delay,
-            # Decay
-            persistence_decay=policy.persistence_decay,
-            exploration_decay=policy.exploration_decay,
-            time_persistence_decay=policy.time_persistence_decay,
-            time_exploration_decay=policy.time_exploration_decay,
-            # Stagnation
-            stagnation_window=policy.stagnation_window,
-            stagnation_effort_floor=policy.stagnation_effort_floor,
-            stagnation_effort_scale=policy.stagnation_effort_scale,
-            stagnation_persistence_scale=policy.stagnation_persistence_scale,
-            progress_threshold=policy.progress_threshold,
-            # Limits
-            exhaustion_threshold=policy.exhaustion_threshold,
-            max_risk=policy.max_risk,
-            max_exploration=policy.max_exploration,
-            max_steps=policy.max_steps,
+            **{attr: getattr(policy, attr) for attr in _PROFILE_FIELDS},
         )
     
     @property
@@ -25,32 +25,50 @@ import sys
 import json
 import signal
 import asyncio
+import hashlib
+import math
 import logging
-import traceback
+import time
+from functools import lru_cache
 from typing import Any, Callable, Dict, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from datetime import datetime, timezone
 
-# Add src to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from fastapi import FastAPI, Request, HTTPException, Response
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
-
-from governance.kernel import GovernanceKernel
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    from governance.kernel import GovernanceKernel
+except ImportError:
+    # Running from a source checkout without the package installed
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from governance.kernel import GovernanceKernel
 from governance.profiles import BALANCED
 from governance.audit import AuditLogger
 from governance.result import EngineResult
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 # =============================================================================
 # Configuration (Docker-friendly environment variables)
 # =============================================================================
 
+PROXY_VERSION = "1.2.0"
+
 PROXY_HOST = os.environ.get("GOVERNANCE_PROXY_HOST", "0.0.0.0")
 PROXY_PORT = int(os.environ.get("GOVERNANCE_PROXY_PORT", "8000"))
 
+# Each worker process holds its own kernel, so budgets and halts are per
+# worker; run more than one only with sticky sessions per agent.
+PROXY_WORKERS = int(os.environ.get("GOVERNANCE_PROXY_WORKERS", "1"))
+# Per-request access logging costs a logging call on every tool call
+PROXY_ACCESS_LOG = os.environ.get("GOVERNANCE_PROXY_ACCESS_LOG", "0") == "1"
+
 # Docker environment variable support
 LOG_LEVEL = os.environ.get("AGENT_HARNESS_LOG_LEVEL", "INFO").upper()
 AUDIT_DIR = os.environ.get("AGENT_HARNESS_AUDIT_DIR", None)
@@ -64,6 +82,102 @@ logging.basicConfig(
 logger = logging.getLogger("governance.proxy")
 
 
+# =============================================================================
+# JSON Encoding
+# =============================================================================
+
+def _all_finite(obj: Any) -> bool:
+    """False if obj holds a NaN or infinite float, at any depth."""
+    if isinstance(obj, float):
+        return math.isfinite(obj)
+    if isinstance(obj, dict):
+        return all(_all_finite(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return all(_all_finite(v) for v in obj)
+    return True
+
+
+def _dumps(content: Any) -> bytes:
+    """
+    Encode a response body as compact UTF-8 JSON.
+    
+    Uses orjson when installed, falling back to the stdlib with the same
+    settings JSONResponse uses (e.g. for non-string dict keys in tool results).
+    orjson would write NaN/Infinity as null, so content holding them goes to
+    the stdlib, which rejects them (allow_nan=False) with or without orjson.
+    """
+    if ORJSON_AVAILABLE and _all_finite(content):
+        try:
+            return orjson.dumps(content)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    """Decode a JSON request body, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # NaN, big ints etc.; the stdlib decides if it is valid
+    return json.loads(raw)
+
+
+def _json_response(content: Any, status_code: int = 200) -> Response:
+    """Build an application/json response from already-encodable content."""
+    return _bytes_response(_dumps(content), status_code)
+
+
+def _bytes_response(body: bytes, status_code: int = 200) -> Response:
+    """Build an application/json response from an encoded body."""
+    return Response(
+        content=body,
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+def _etag(body: bytes) -> str:
+    """Strong ETag for a response body."""
+    return '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+
+
+def _conditional_response(
+    request: Request,
+    body: bytes,
+    etag: str,
+    media_type: str,
+) -> Response:
+    """Return 304 when the client already holds this body, else the body."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (
+        if_none_match.strip() == "*"
+        or etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    ):
+        return Response(status_code=304, headers={"etag": etag})
+    return Response(content=body, media_type=media_type, headers={"etag": etag})
+
+
+# Prometheus scrapes within this many seconds share one rendered body
+METRICS_CACHE_TTL = 1.0
+
+
+# Constant response bodies, encoded once
+_HEALTH_BODY = _dumps({"status": "healthy", "version": PROXY_VERSION})
+
+
+@lru_cache(maxsize=256)
+def _tool_not_found_body(tool_name: str) -> bytes:
+    """404 body for an unknown tool; clients tend to retry the same name."""
+    return _dumps({"error": f"Tool not found: {tool_name}"})
+
+
 # =============================================================================
 # Mock Tool Backend (for testing)
 # =============================================================================
@@ -87,9 +201,10 @@ class MockToolBackend:
     
     def execute(self, tool_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """Execute a tool by name."""
-        if tool_name not in self._tools:
+        handler = self._tools.get(tool_name)
+        if handler is None:
             raise ValueError(f"Unknown tool: {tool_name}")
-        return self._tools[tool_name](params)
+        return handler(params)
     
     def has_tool(self, tool_name: str) -> bool:
         """Check if a tool exists."""
@@ -100,38 +215,101 @@ class MockToolBackend:
 # Fail-Closed Middleware
 # =============================================================================
 
-class FailClosedMiddleware(BaseHTTPMiddleware):
+# Fail-closed responses differ only in their body (the error text)
+_FAIL_CLOSED_CONTENT_TYPE = (b"content-type", b"application/json")
+
+
+class _TokenBucket:
+    """Rate limiter allowing bursts of `burst` events and `rate` per second."""
+    
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._stamp = time.monotonic()
+    
+    def consume(self) -> bool:
+        """Take one token if available."""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._stamp) * self.rate)
+        self._stamp = now
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return True
+        return False
+
+
+class FailClosedMiddleware:
     """
     Middleware that ensures fail-closed behavior.
     
     Any unhandled exception in the request processing will result in
     a 403 Forbidden response, never a silent pass-through.
+    
+    Implemented as plain ASGI rather than BaseHTTPMiddleware, so requests
+    are passed straight through without a Request object, a call_next task
+    or a body stream per call.
     """
     
-    async def dispatch(self, request: Request, call_next):
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        # Error logs (with tracebacks) are capped so a burst of failing
+        # requests is not throttled by log formatting and I/O
+        self._error_log = _TokenBucket(rate=10.0, burst=20)
+        self._suppressed_errors = 0
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        response_started = False
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+        
         try:
-            response = await call_next(request)
-            return response
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
             # Log the error for debugging (logs to stdout for Docker)
-            logger.error(f"Enforcement error: {e}", exc_info=True)
+            if self._error_log.consume():
+                logger.error(
+                    "Enforcement error: %s (%d similar errors suppressed)",
+                    e, self._suppressed_errors, exc_info=True,
+                )
+                self._suppressed_errors = 0
+            else:
+                self._suppressed_errors += 1
+            if response_started:
+                # Too late to replace the response; the connection is aborted
+                raise
             # FAIL-CLOSED: Always return 403 on any error
-            return JSONResponse(
-                status_code=403,
-                content={
-                    "blocked": True,
-                    "halt_reason": "ENFORCEMENT_ERROR",
-                    "error": str(e),
-                    "message": "Action blocked due to enforcement error (fail-closed)"
-                }
-            )
+            body = _dumps({
+                "blocked": True,
+                "halt_reason": "ENFORCEMENT_ERROR",
+                # Only the type; details stay in the server log
+                "error": type(e).__name__,
+                "message": "Action blocked due to enforcement error (fail-closed)"
+            })
+            await send({
+                "type": "http.response.start",
+                "status": 403,
+                "headers": [
+                    (b"content-length", str(len(body)).encode("latin-1")),
+                    _FAIL_CLOSED_CONTENT_TYPE,
+                ],
+            })
+            await send({"type": "http.response.body", "body": body})
 
 
 # =============================================================================
 # Proxy Enforcer Application
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ToolCallRequest:
     """Incoming tool call request."""
     tool_name: str
@@ -144,7 +322,7 @@ class ToolCallRequest:
     trust: float = 1.0
 
 
-@dataclass
+@dataclass(slots=True)
 class EnforcementDecision:
     """Result of governance enforcement check."""
     allowed: bool
@@ -238,6 +416,140 @@ class ProxyEnforcer:
         return self.backend.execute(tool_name, params)
 
 
+# =============================================================================
+# Routes
+# =============================================================================
+
+async def call_tool(tool_name: str, request: Request):
+    """
+    Execute a tool call with governance enforcement.
+    
+    Path Parameters:
+        tool_name: Name of the tool to execute
+    
+    Request Body:
+        {
+            "params": {...},           # Tool parameters
+            "signals": {               # Optional signal overrides
+                "reward": 0.0,
+                "novelty": 0.0,
+                "urgency": 0.0,
+                "difficulty": 0.0,
+                "trust": 1.0
+            }
+        }
+    
+    Returns:
+        200: Tool executed successfully
+        403: Blocked by governance (halted or error)
+        404: Tool not found
+    """
+    enforcer: ProxyEnforcer = request.app.state.enforcer
+    
+    try:
+        raw = await request.body()
+        body = _loads(raw) if raw else {}
+    except Exception:
+        body = {}
+    
+    params = body.get("params", {})
+    signals = body.get("signals", {})
+    
+    # Build tool call request
+    tool_request = ToolCallRequest(
+        tool_name=tool_name,
+        params=params,
+        reward=signals.get("reward", 0.0),
+        novelty=signals.get("novelty", 0.0),
+        urgency=signals.get("urgency", 0.0),
+        difficulty=signals.get("difficulty", 0.0),
+        trust=signals.get("trust", 1.0),
+    )
+    
+    # Enforce governance decision
+    decision = enforcer.enforce(tool_request)
+    
+    if not decision.allowed:
+        # BLOCKED: Return 403 with halt reason
+        return _json_response(
+            {
+                "blocked": True,
+                "halt_reason": decision.halt_reason,
+                "step": decision.step,
+                "budget": decision.budget_snapshot,
+            },
+            status_code=403,
+        )
+    
+    # ALLOWED: Execute the tool
+    if not enforcer.backend.has_tool(tool_name):
+        return _bytes_response(_tool_not_found_body(tool_name), status_code=404)
+    
+    try:
+        result = enforcer.execute_tool(tool_name, params)
+        return _json_response(
+            {
+                "allowed": True,
+                "step": decision.step,
+                "budget": decision.budget_snapshot,
+                "result": result,
+            },
+            status_code=200,
+        )
+    except Exception as e:
+        # FAIL-CLOSED: Error during execution -> 403
+        return _json_response(
+            {
+                "blocked": True,
+                "halt_reason": f"EXECUTION_ERROR: {str(e)}",
+                "step": decision.step,
+            },
+            status_code=403,
+        )
+
+
+async def health_check():
+    """Health check endpoint."""
+    return _bytes_response(_HEALTH_BODY)
+
+
+async def get_audit(request: Request):
+    """
+    Get current audit log.
+    
+    Responses carry an ETag; a matching If-None-Match gets an empty 304.
+    """
+    enforcer: ProxyEnforcer = request.app.state.enforcer
+    body = _dumps(enforcer.audit.dump())
+    return _conditional_response(request, body, _etag(body), "application/json")
+
+
+async def get_metrics(request: Request):
+    """
+    Prometheus metrics endpoint.
+    
+    Returns metrics in Prometheus text format for scraping. The rendered
+    body is reused for METRICS_CACHE_TTL seconds and carries an ETag.
+    """
+    from governance.metrics import PrometheusRegistry
+    
+    app = request.app
+    
+    # Get the registry from app state or create one
+    if not hasattr(app.state, 'registry'):
+        app.state.registry = PrometheusRegistry()
+    
+    now = time.monotonic()
+    cached = getattr(app.state, 'metrics_cache', None)
+    if cached is None or cached[0] is not app.state.registry or now - cached[3] > METRICS_CACHE_TTL:
+        body = app.state.registry.to_prometheus_bytes()
+        cached = app.state.metrics_cache = (app.state.registry, body, _etag(body), now)
+    
+    return _conditional_response(
+        request, cached[1], cached[2], "text/plain; charset=utf-8"
+    )
+
+
 def create_app(
     kernel: Optional[GovernanceKernel] = None,
     backend: Optional[MockToolBackend] = None,
@@ -257,7 +569,7 @@ def create_app(
     app = FastAPI(
         title="Governance Proxy Enforcer",
         description="Network-level governance enforcement for agent tool calls",
-        version="1.2.0",
+        version=PROXY_VERSION,
     )
     
     # Add fail-closed middleware
@@ -273,121 +585,10 @@ def create_app(
     # Store enforcer in app state for access in routes
     app.state.enforcer = enforcer
     
-    @app.post("/tool/{tool_name}")
-    async def call_tool(tool_name: str, request: Request):
-        """
-        Execute a tool call with governance enforcement.
-        
-        Path Parameters:
-            tool_name: Name of the tool to execute
-        
-        Request Body:
-            {
-                "params": {...},           # Tool parameters
-                "signals": {               # Optional signal overrides
-                    "reward": 0.0,
-                    "novelty": 0.0,
-                    "urgency": 0.0,
-                    "difficulty": 0.0,
-                    "trust": 1.0
-                }
-            }
-        
-        Returns:
-            200: Tool executed successfully
-            403: Blocked by governance (halted or error)
-            404: Tool not found
-        """
-        try:
-            body = await request.json()
-        except Exception:
-            body = {}
-        
-        params = body.get("params", {})
-        signals = body.get("signals", {})
-        
-        # Build tool call request
-        tool_request = ToolCallRequest(
-            tool_name=tool_name,
-            params=params,
-            reward=signals.get("reward", 0.0),
-            novelty=signals.get("novelty", 0.0),
-            urgency=signals.get("urgency", 0.0),
-            difficulty=signals.get("difficulty", 0.0),
-            trust=signals.get("trust", 1.0),
-        )
-        
-        # Enforce governance decision
-        decision = enforcer.enforce(tool_request)
-        
-        if not decision.allowed:
-            # BLOCKED: Return 403 with halt reason
-            return JSONResponse(
-                status_code=403,
-                content={
-                    "blocked": True,
-                    "halt_reason": decision.halt_reason,
-                    "step": decision.step,
-                    "budget": decision.budget_snapshot,
-                }
-            )
-        
-        # ALLOWED: Execute the tool
-        if not enforcer.backend.has_tool(tool_name):
-            return JSONResponse(
-                status_code=404,
-                content={"error": f"Tool not found: {tool_name}"}
-            )
-        
-        try:
-            result = enforcer.execute_tool(tool_name, params)
-            return JSONResponse(
-                status_code=200,
-                content={
-                    "allowed": True,
-                    "step": decision.step,
-                    "budget": decision.budget_snapshot,
-                    "result": result,
-                }
-            )
-        except Exception as e:
-            # FAIL-CLOSED: Error during execution -> 403
-            return JSONResponse(
-                status_code=403,
-                content={
-                    "blocked": True,
-                    "halt_reason": f"EXECUTION_ERROR: {str(e)}",
-                    "step": decision.step,
-                }
-            )
-    
-    @app.get("/health")
-    async def health_check():
-        """Health check endpoint."""
-        return {"status": "healthy", "version": "1.2.0"}
-    
-    @app.get("/audit")
-    async def get_audit():
-        """Get current audit log."""
-        return enforcer.audit.dump()
-    
-    @app.get("/metrics")
-    async def get_metrics():
-        """
-        Prometheus metrics endpoint.
-        
-        Returns metrics in Prometheus text format for scraping.
-        """
-        from governance.metrics import PrometheusRegistry
-        
-        # Get the registry from app state or create one
-        if not hasattr(app.state, 'registry'):
-            app.state.registry = PrometheusRegistry()
-        
-        return Response(
-            content=app.state.registry.to_prometheus_text(),
-            media_type="text/plain; charset=utf-8"
-        )
+    app.add_api_route("/tool/{tool_name}", call_tool, methods=["POST"])
+    app.add_api_route("/health", health_check, methods=["GET"])
+    app.add_api_route("/audit", get_audit, methods=["GET"])
+    app.add_api_route("/metrics", get_metrics, methods=["GET"])
     
     return app
 
@@ -419,11 +620,41 @@ signal.signal(signal.SIGINT, _handle_shutdown)
 # CLI Entry Point
 # =============================================================================
 
-if __name__ == "__main__":
+def run(
+    host: str = PROXY_HOST,
+    port: int = PROXY_PORT,
+    workers: int = PROXY_WORKERS,
+) -> None:
+    """
+    Serve the default application with uvicorn.
+    
+    uvicorn picks uvloop and httptools automatically when they are installed
+    (the uvicorn[standard] dependency provides both). For workers > 1 the app
+    is passed as an import string so each forked worker builds its own; the
+    usual starting point is 2 * cores + 1, keeping in mind that governance
+    state is not shared between workers.
+    
+    Args:
+        host: Interface to bind to
+        port: Port to bind to
+        workers: Number of worker processes
+    """
     import uvicorn
     
+    target = "governance.proxy_enforcer:app" if workers > 1 else app
+    uvicorn.run(
+        target,
+        host=host,
+        port=port,
+        workers=workers,
+        access_log=PROXY_ACCESS_LOG,
+    )
+
+
+if __name__ == "__main__":
     logger.info(f"Starting Governance Proxy Enforcer on {PROXY_HOST}:{PROXY_PORT}")
     logger.info(f"Log level: {LOG_LEVEL}")
+    logger.info(f"Workers: {PROXY_WORKERS}")
     if AUDIT_DIR:
         logger.info(f"Audit directory: {AUDIT_DIR}")
     logger.info("Endpoints:")
@@ -432,4 +663,4 @@ if __name__ == "__main__":
     logger.info(f"  GET  /audit             - View audit log")
     logger.info(f"  GET  /metrics           - Prometheus metrics")
     
-    uvicorn.run(app, host=PROXY_HOST, port=PROXY_PORT)
+    run()
@@ -27,6 +27,8 @@ import sys
 import os
 import time
 
+import numpy as np
+
 # Add src to path if running as script
 if __name__ == "__main__":
     sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -49,17 +51,28 @@ from governance import GovernanceAgent, step, Signals, PROFILES, ProfileType
 from governance.metrics import MetricsCollector, GovernanceMetrics
 from typing import List, Optional
 
+def _detect_unicode_support() -> bool:
+    """Whether stdout can encode every glyph the dashboard draws."""
+    try:
+        "█░▂▃▄▅▆▇┌─┐│├┤└┘".encode(sys.stdout.encoding or 'utf-8')
+        return True
+    except (UnicodeEncodeError, LookupError):
+        return False
+
+
+# Decided once at import; use ASCII-safe glyphs on consoles (e.g. Windows
+# code pages) that cannot encode the Unicode blocks.
+_USE_UNICODE = _detect_unicode_support()
+_BAR_FILLED, _BAR_EMPTY = ("█", "░") if _USE_UNICODE else ("#", "-")
+_SPARK_EMPTY = " " if _USE_UNICODE else "-"
+# Sparkline glyphs as an array so a whole row can be gathered by index
+_SPARK_CHARS = np.array(list(" ▂▃▄▅▆▇█" if _USE_UNICODE else " _.,-~=+#"))
+
 
 def create_bar(value: float, width: int = 20, filled: str = None, empty: str = None) -> str:
     """Create an ASCII progress bar."""
-    # Use ASCII-safe characters on Windows to avoid encoding issues
     if filled is None:
-        try:
-            # Test if we can encode a sample Unicode block
-            "█".encode(sys.stdout.encoding or 'utf-8')
-            filled, empty = "█", "░"
-        except (UnicodeEncodeError, LookupError):
-            filled, empty = "#", "-"
+        filled, empty = _BAR_FILLED, _BAR_EMPTY
     if empty is None:
         empty = "-"
     filled_width = int(value * width)
@@ -68,32 +81,21 @@ def create_bar(value: float, width: int = 20, filled: str = None, empty: str = N
 
 def create_sparkline(values: List[float], width: int = 30) -> str:
     """Create an ASCII sparkline graph."""
-    # Use ASCII-safe characters on Windows
-    try:
-        # Test if we can encode a sample sparkline block
-        "▃".encode(sys.stdout.encoding or 'utf-8')
-        empty_char = " "
-        chars = " ▂▃▄▅▆▇█"
-    except (UnicodeEncodeError, LookupError):
-        empty_char = "-"
-        chars = " _.,-~=+#"
+    empty_char = _SPARK_EMPTY
+    chars = _SPARK_CHARS
     
-    if not values:
+    if not len(values):
         return empty_char * width
     
     # Take last `width` values
-    values = values[-width:]
+    arr = np.asarray(values[-width:], dtype=np.float64)
     
-    # Normalize to [0, 1]
-    min_val = min(values) if values else 0
-    max_val = max(values) if values else 1
+    # Normalize to [0, 1] and map to glyph indices in one pass
+    min_val = arr.min()
+    max_val = arr.max()
     range_val = max_val - min_val if max_val != min_val else 1
-    
-    result = ""
-    for v in values:
-        normalized = (v - min_val) / range_val
-        idx = int(normalized * (len(chars) - 1))
-        result += chars[idx]
+    idx = ((arr - min_val) / range_val * (len(chars) - 1)).astype(np.intp)
+    result = "".join(chars[idx])
     
     # Pad to width
     result += empty_char * (width - len(result))
@@ -105,30 +107,56 @@ class GovernanceVisualizer:
     Real-time terminal dashboard for governance state visualization.
     """
     
-    def __init__(self):
+    # Columns kept for trend rendering
+    _COLUMNS = ("effort", "risk", "exploration", "persistence")
+    
+    def __init__(self, target_fps: float = 20.0, max_history: int = 100):
         self.console = Console() if RICH_AVAILABLE else None
-        self.history: List[GovernanceMetrics] = []
-        self.max_history = 100
+        self.max_history = max_history
+        # Latest snapshot drives the scalar readouts
+        self.latest: Optional[GovernanceMetrics] = None
+        # Column ring buffers of length 2 * max_history. Each value is written
+        # at i and i + max_history, so the last max_history values are always
+        # one contiguous slice (no reordering copy when rendering).
+        self._count = 0
+        self._columns = {
+            name: np.zeros(2 * max_history, dtype=np.float64)
+            for name in self._COLUMNS
+        }
+        # Frame throttling: print() redraws at most target_fps times a second
+        self.target_fps = target_fps
+        self._last_draw = 0.0
+        # Optional rich Live display; when set, frames update in place
+        self.live = None
     
     def update(self, metrics: GovernanceMetrics) -> None:
         """Add a new metrics snapshot to history."""
-        self.history.append(metrics)
-        if len(self.history) > self.max_history:
-            self.history = self.history[-self.max_history:]
+        cap = self.max_history
+        i = self._count % cap
+        for name, column in self._columns.items():
+            column[i] = column[i + cap] = getattr(metrics, name)
+        self._count += 1
+        self.latest = metrics
+    
+    def column(self, name: str) -> np.ndarray:
+        """Return the retained history of one column, oldest first (a view)."""
+        cap = self.max_history
+        if self._count <= cap:
+            return self._columns[name][:self._count]
+        start = self._count % cap
+        return self._columns[name][start:start + cap]
     
     def render_simple(self) -> str:
         """Render a simple ASCII dashboard (no rich dependency)."""
-        if not self.history:
+        if self.latest is None:
             return "No data yet..."
         
-        m = self.history[-1]
-        effort_history = [h.effort for h in self.history]
-        risk_history = [h.risk for h in self.history]
+        m = self.latest
+        effort_history = self.column("effort")
+        risk_history = self.column("risk")
         
-        try:
-             # Test if we can encode box characters
-             "┌".encode(sys.stdout.encoding or 'utf-8')
-             lines = [
+        if _USE_UNICODE:
+            lines = [
                 "┌" + "─" * 70 + "┐",
                 "│" + " Agent Harness Governance Dashboard ".center(70) + "│",
                 "├" + "─" * 70 + "┤",
@@ -152,7 +180,7 @@ class GovernanceVisualizer:
                 f"│   {create_sparkline(risk_history, 60)}".ljust(71) + "│",
                 "└" + "─" * 70 + "┘",
             ]
-        except (UnicodeEncodeError, LookupError):
+        else:
             # Pure ASCII fallback for simple render
             lines = [
                 "+" + "-" * 70 + "+",
@@ -186,12 +214,12 @@ class GovernanceVisualizer:
     
     def render_rich(self) -> Panel:
         """Render a rich-formatted dashboard panel."""
-        if not RICH_AVAILABLE or not self.history:
+        if not RICH_AVAILABLE or self.latest is None:
             return Panel("No data yet...")
         
-        m = self.history[-1]
-        effort_history = [h.effort for h in self.history]
-        risk_history = [h.risk for h in self.history]
+        m = self.latest
+        effort_history = self.column("effort")
+        risk_history = self.column("risk")
         
         # Build content
         content = []
@@ -263,9 +291,21 @@ class GovernanceVisualizer:
             box=box.DOUBLE,
         )
     
-    def print(self) -> None:
-        """Print the current dashboard state."""
-        if RICH_AVAILABLE and self.console:
+    def print(self, force: bool = False) -> None:
+        """
+        Print the current dashboard state.
+        
+        Frames requested faster than target_fps are skipped unless force
+        is set (use it for the final frame so the last state is shown).
+        """
+        now = time.monotonic()
+        if not force and now - self._last_draw < 1.0 / self.target_fps:
+            return
+        self._last_draw = now
+        
+        if self.live is not None:
+            self.live.update(self.render_rich(), refresh=True)
+        elif RICH_AVAILABLE and self.console:
             self.console.clear()
             self.console.print(self.render_rich())
         else:
@@ -273,6 +313,24 @@ class GovernanceVisualizer:
             print(self.render_simple())
 
 
+class _Ticker:
+    """Fixed-rate pacing against a monotonic deadline (render time does not drift the period)."""
+    
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._next = time.monotonic() + interval
+    
+    def wait(self) -> None:
+        """Sleep until the next deadline, then advance it by one interval."""
+        now = time.monotonic()
+        if self._next > now:
+            time.sleep(self._next - now)
+        elif now - self._next > self.interval:
+            # Fell more than a tick behind; resync instead of bursting
+            self._next = now
+        self._next += self.interval
+
+
 def run_demo():
     """Run a demo simulation with random signals."""
     import random
@@ -294,6 +352,14 @@ def run_demo():
     print()
     time.sleep(1)
     
+    live = None
+    if RICH_AVAILABLE:
+        live = Live(visualizer.render_rich(), console=visualizer.console, auto_refresh=False)
+        live.start()
+        visualizer.live = live
+    
+    ticker = _Ticker(0.15)
+    
     try:
         for i in range(100):
             # Generate random signals (with some patterns)
@@ -321,7 +387,7 @@ def run_demo():
             result = step(agent, signals)
             collector.record(result, signals)
             
-            # Render
+            # Render (throttled; the final frame is forced below)
             visualizer.print()
             
             if result.halted:
@@ -332,11 +398,17 @@ def run_demo():
                 print("=" * 60)
                 break
             
-            time.sleep(0.15)
+            ticker.wait()
     
     except KeyboardInterrupt:
         print("\n\nDemo stopped by user.")
     
+    finally:
+        visualizer.print(force=True)
+        if live is not None:
+            live.stop()
+            visualizer.live = None
+    
     # Print summary
     print()
     print("=" * 60)
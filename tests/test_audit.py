@@ -67,3 +67,12 @@ def test_audit_dump_json(logger, tmp_path):
     with open(log_file) as f:
         loaded = json.load(f)
         assert loaded[0]['halt_reason'] == "tired"
+
+def test_audit_timestamp_matches_isoformat():
+    """Cached timestamps should match datetime.isoformat() output exactly."""
+    from datetime import datetime, timezone
+    from governance._clock import utc_timestamp
+
+    for ns in (1_700_000_000_123_456_789, 1_700_000_000_000_000_000, 1_700_000_001_000_001_000):
+        expected = datetime.fromtimestamp(ns // 1000 / 1e6, timezone.utc).isoformat()
+        assert utc_timestamp(ns) == expected
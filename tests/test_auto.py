@@ -0,0 +1,48 @@
+import pytest
+from governance import GovernanceAgent, governed, get_gov
+from governance.guarantees import StepResult
+
+
+class Plain:
+    pass
+
+
+class Slotted:
+    __slots__ = ("value", "__weakref__")
+
+
+@pytest.fixture
+def agent():
+    return GovernanceAgent()
+
+
+def test_governed_attaches_result_to_plain_objects(agent):
+    """Objects with a __dict__ carry the governance result as _gov."""
+    @governed(agent)
+    def tool():
+        return Plain()
+
+    result = tool()
+    assert isinstance(result._gov, StepResult)
+    assert get_gov(result) is result._gov
+
+
+def test_governed_attaches_result_to_slotted_objects(agent):
+    """Slotted objects are tracked without being mutated."""
+    @governed(agent)
+    def tool():
+        return Slotted()
+
+    result = tool()
+    assert isinstance(get_gov(result), StepResult)
+
+
+def test_governed_passes_through_builtin_results(agent):
+    """Values that cannot carry an attachment are returned unchanged."""
+    @governed(agent)
+    def tool():
+        return "x" * 5000
+
+    result = tool()
+    assert result == "x" * 5000
+    assert get_gov(result) is None
@@ -139,6 +139,48 @@ class TestProxyEnforcementBlocks:
         assert resp.json()["blocked"] is True
         assert "EXECUTION_ERROR" in resp.json()["halt_reason"]
     
+    def test_proxy_fails_closed_on_unhandled_error(self):
+        """Errors escaping a route should become a 403, not a 500."""
+        from governance.proxy_enforcer import create_app, MockToolBackend
+        
+        class BrokenBackend(MockToolBackend):
+            def has_tool(self, tool_name):
+                raise RuntimeError("registry unavailable")
+        
+        app = create_app(kernel=GovernanceKernel(BALANCED), backend=BrokenBackend())
+        client = TestClient(app)
+        
+        resp = client.post("/tool/echo", json={"params": {}, "signals": {"reward": 0.5}})
+        
+        assert resp.status_code == 403
+        assert resp.headers["content-type"] == "application/json"
+        body = resp.json()
+        assert body["blocked"] is True
+        assert body["halt_reason"] == "ENFORCEMENT_ERROR"
+        assert body["error"] == "RuntimeError"
+    
+    def test_proxy_error_logging_is_rate_limited(self, caplog, monkeypatch):
+        """A burst of failing requests should not log a traceback each."""
+        import types
+        import governance.proxy_enforcer as proxy_module
+        from governance.proxy_enforcer import create_app, MockToolBackend
+        
+        # Freeze the limiter's clock so no tokens refill during the burst
+        monkeypatch.setattr(proxy_module, "time", types.SimpleNamespace(monotonic=lambda: 0.0))
+        
+        class BrokenBackend(MockToolBackend):
+            def has_tool(self, tool_name):
+                raise RuntimeError("registry unavailable")
+        
+        client = TestClient(create_app(kernel=GovernanceKernel(BALANCED), backend=BrokenBackend()))
+        
+        with caplog.at_level("ERROR", logger="governance.proxy"):
+            for _ in range(30):
+                assert client.post("/tool/echo", json={"signals": {"reward": 0.5}}).status_code == 403
+        
+        errors = [r for r in caplog.records if r.name == "governance.proxy"]
+        assert len(errors) == 20
+    
     def test_proxy_health_endpoint(self):
         """Health endpoint should return healthy status."""
         from governance.proxy_enforcer import create_app
@@ -149,7 +191,41 @@ class TestProxyEnforcementBlocks:
         resp = client.get("/health")
         assert resp.status_code == 200
         assert resp.json()["status"] == "healthy"
+        assert resp.headers["content-type"] == "application/json"
     
+    def test_proxy_unknown_tool_returns_404(self):
+        """Allowed calls to an unregistered tool should return 404."""
+        from governance.proxy_enforcer import create_app
+        
+        client = TestClient(create_app(kernel=GovernanceKernel(BALANCED)))
+        
+        for _ in range(2):
+            resp = client.post("/tool/missing", json={"signals": {"reward": 0.5}})
+            assert resp.status_code == 404
+            assert resp.json() == {"error": "Tool not found: missing"}
+
+    def test_proxy_json_handling_does_not_depend_on_orjson(self):
+        """Non-finite results are blocked and stdlib-only bodies still parse."""
+        from governance.proxy_enforcer import create_app, MockToolBackend
+
+        backend = MockToolBackend()
+        backend.register("nan_tool", lambda params: {"v": float("nan")})
+        client = TestClient(create_app(kernel=GovernanceKernel(BALANCED), backend=backend))
+
+        resp = client.post("/tool/nan_tool", json={"signals": {"reward": 0.5}})
+        assert resp.status_code == 403
+        assert resp.json()["halt_reason"].startswith("EXECUTION_ERROR: Out of range float")
+
+        # json.loads accepts a NaN literal that orjson rejects; the body must
+        # still be parsed rather than treated as empty
+        resp = client.post(
+            "/tool/echo",
+            content=b'{"params":{"message":"hi","x":NaN},"signals":{"reward":0.5}}',
+            headers={"content-type": "application/json"},
+        )
+        assert resp.status_code == 200
+        assert resp.json()["result"] == {"result": "hi"}
+
     def test_stagnation_halts_with_403(self):
         """Verify stagnation detection leads to 403."""
         from governance.proxy_enforcer import create_app
@@ -298,6 +374,216 @@ class TestAuditChainVerification:
         assert is_valid is False
         assert "not found" in error.lower()
 
+    def test_buffered_logger_verifies_after_close(self, temp_audit_file):
+        """Buffered writes should produce a valid chain once closed."""
+        logger = HashChainedAuditLogger(filepath=temp_audit_file, flush_every=4)
+
+        for i in range(10):
+            result = EngineResult(
+                state=None,
+                budget=BehaviorBudget(0.9, 0.1, 0.9, 0.1),
+                halted=False,
+                failure=FailureType.NONE,
+                reason=None,
+                mode=Mode.IDLE
+            )
+            logger.log(step=i+1, action=f"action_{i}", params={}, signals={}, result=result)
+        logger.close()
+
+        is_valid, error = HashChainedAuditLogger.verify_chain(temp_audit_file)
+
+        assert is_valid is True
+        assert error is None
+        assert logger.entries_written == 10
+
+    def test_durable_logger_fsyncs_once_per_flush(self, temp_audit_file, monkeypatch):
+        """durable=True should fsync each write, i.e. once per buffered batch."""
+        import governance.audit as audit_module
+        fsyncs = []
+        monkeypatch.setattr(audit_module.os, "fsync", fsyncs.append)
+        logger = HashChainedAuditLogger(
+            filepath=temp_audit_file, flush_every=4, durable=True
+        )
+
+        for i in range(8):
+            result = EngineResult(
+                state=None,
+                budget=BehaviorBudget(0.9, 0.1, 0.9, 0.1),
+                halted=False,
+                failure=FailureType.NONE,
+                reason=None,
+                mode=Mode.IDLE
+            )
+            logger.log(step=i+1, action=f"action_{i}", params={}, signals={}, result=result)
+        logger.close()
+
+        assert len(fsyncs) == 2
+        is_valid, error = HashChainedAuditLogger.verify_chain(temp_audit_file)
+        assert is_valid is True
+
+    def test_failed_write_keeps_unwritten_entries(self, temp_audit_file, monkeypatch):
+        """A write error surfaces as-is and a later flush completes the chain."""
+        import governance.audit as audit_module
+        real_write = os.write
+        calls = []
+
+        def short_then_full_disk(fd, data):
+            calls.append(len(data))
+            if len(calls) == 1:
+                return real_write(fd, data[:10])  # short write tears a line
+            raise OSError(28, "No space left on device")
+
+        logger = HashChainedAuditLogger(filepath=temp_audit_file, flush_every=4)
+        monkeypatch.setattr(audit_module.os, "write", short_then_full_disk)
+        with pytest.raises(OSError) as exc:
+            for i in range(4):
+                result = EngineResult(
+                    state=None,
+                    budget=BehaviorBudget(0.9, 0.1, 0.9, 0.1),
+                    halted=False,
+                    failure=FailureType.NONE,
+                    reason=None,
+                    mode=Mode.IDLE
+                )
+                logger.log(step=i+1, action=f"action_{i}", params={}, signals={}, result=result)
+        assert exc.value.errno == 28
+
+        monkeypatch.setattr(audit_module.os, "write", real_write)
+        logger.close()
+
+        is_valid, error = HashChainedAuditLogger.verify_chain(temp_audit_file)
+        assert is_valid is True, error
+        with open(temp_audit_file) as f:
+            assert len(f.readlines()) == 4
+
+    def test_context_manager_closes_and_resumes_chain(self, temp_audit_file):
+        """A logger used as a context manager should close on exit and a new
+        logger on the same file should continue the chain."""
+        result = EngineResult(
+            state=None,
+            budget=BehaviorBudget(0.9, 0.1, 0.9, 0.1),
+            halted=False,
+            failure=FailureType.NONE,
+            reason=None,
+            mode=Mode.IDLE
+        )
+        with HashChainedAuditLogger(filepath=temp_audit_file, flush_every=8) as logger:
+            for i in range(3):
+                logger.log(step=i+1, action=f"action_{i}", params={}, signals={}, result=result)
+
+        with HashChainedAuditLogger(filepath=temp_audit_file) as resumed:
+            assert resumed.entries_written == 3
+            resumed.log(step=4, action="action_3", params={}, signals={}, result=result)
+
+        assert HashChainedAuditLogger.verify_chain(temp_audit_file) == (True, None)
+
+    def test_in_memory_window_is_bounded(self, temp_audit_file):
+        """Only the most recent entries stay in memory; the file keeps all."""
+        logger = HashChainedAuditLogger(filepath=temp_audit_file, max_in_memory_entries=3)
+
+        for i in range(10):
+            result = EngineResult(
+                state=None,
+                budget=BehaviorBudget(0.9, 0.1, 0.9, 0.1),
+                halted=False,
+                failure=FailureType.NONE,
+                reason=None,
+                mode=Mode.IDLE
+            )
+            logger.log(step=i+1, action=f"action_{i}", params={}, signals={}, result=result)
+        logger.close()
+
+        assert [e["step"] for e in logger.dump()] == [8, 9, 10]
+        assert logger.entries_written == 10
+        assert HashChainedAuditLogger.verify_chain(temp_audit_file) == (True, None)
+
+    def test_background_writer_verifies_after_close(self, temp_audit_file):
+        """Background writes should preserve chain order and validity."""
+        logger = HashChainedAuditLogger(filepath=temp_audit_file, background=True)
+
+        for i in range(50):
+            result = EngineResult(
+                state=None,
+                budget=BehaviorBudget(0.9, 0.1, 0.9, 0.1),
+                halted=False,
+                failure=FailureType.NONE,
+                reason=None,
+                mode=Mode.IDLE
+            )
+            logger.log(step=i+1, action=f"action_{i}", params={}, signals={}, result=result)
+        logger.close()
+
+        is_valid, error = HashChainedAuditLogger.verify_chain(temp_audit_file)
+
+        assert is_valid is True
+        assert error is None
+        with open(temp_audit_file) as f:
+            assert len(f.readlines()) == 50
+
+    def test_chain_verification_window(self, temp_audit_file):
+        """start/limit should verify only the requested slice of the chain."""
+        logger = HashChainedAuditLogger(filepath=temp_audit_file)
+
+        for i in range(5):
+            result = EngineResult(
+                state=None,
+                budget=BehaviorBudget(0.9, 0.1, 0.9, 0.1),
+                halted=False,
+                failure=FailureType.NONE,
+                reason=None,
+                mode=Mode.IDLE
+            )
+            logger.log(step=i+1, action=f"action_{i}", params={}, signals={}, result=result)
+        logger.close()
+
+        # Tamper with the first entry only
+        with open(temp_audit_file, 'r') as f:
+            lines = f.readlines()
+        entry = json.loads(lines[0])
+        entry["action"] = "TAMPERED_ACTION"
+        lines[0] = json.dumps(entry) + "\n"
+        with open(temp_audit_file, 'w') as f:
+            f.writelines(lines)
+
+        assert HashChainedAuditLogger.verify_chain(temp_audit_file)[0] is False
+        assert HashChainedAuditLogger.verify_chain(temp_audit_file, start=1) == (True, None)
+        assert HashChainedAuditLogger.verify_chain(temp_audit_file, start=3, limit=1) == (True, None)
+        offset = len(lines[0].encode())
+        assert HashChainedAuditLogger.verify_chain(
+            temp_audit_file, start_offset=offset
+        ) == (True, None)
+
+
+    def test_parallel_verification_matches_streaming(self, temp_audit_file, monkeypatch):
+        """workers > 1 should give the same verdict and error as one process."""
+        import governance.audit as audit_module
+        monkeypatch.setattr(audit_module, "_PARALLEL_MIN_BYTES", 0)
+        logger = HashChainedAuditLogger(filepath=temp_audit_file)
+
+        for i in range(40):
+            result = EngineResult(
+                state=None,
+                budget=BehaviorBudget(0.9, 0.1, 0.9, 0.1),
+                halted=False,
+                failure=FailureType.NONE,
+                reason=None,
+                mode=Mode.IDLE
+            )
+            logger.log(step=i+1, action=f"action_{i}", params={}, signals={}, result=result)
+        logger.close()
+
+        assert HashChainedAuditLogger.verify_chain(temp_audit_file, workers=3) == (True, None)
+
+        # Drop an entry in the middle page to break linkage
+        with open(temp_audit_file, 'r') as f:
+            lines = f.readlines()
+        del lines[20]
+        with open(temp_audit_file, 'w') as f:
+            f.writelines(lines)
+
+        expected = HashChainedAuditLogger.verify_chain(temp_audit_file)
+        assert expected[0] is False
+        assert HashChainedAuditLogger.verify_chain(temp_audit_file, workers=3) == expected
 
 # =============================================================================
 # C. Metrics Endpoint Tests
@@ -325,6 +611,28 @@ class TestMetricsEndpoint:
         assert "halts_by_reason" in content
         assert "governance_budget_effort" in content
     
+    def test_audit_and_metrics_support_conditional_requests(self):
+        """Unchanged /audit and /metrics bodies should be answered with 304."""
+        from governance.proxy_enforcer import create_app
+        
+        client = TestClient(create_app(kernel=GovernanceKernel(BALANCED)))
+        client.post("/tool/echo", json={"params": {"message": "hi"}, "signals": {"reward": 0.5}})
+        
+        etags = {}
+        for path in ("/audit", "/metrics"):
+            etags[path] = client.get(path).headers["etag"]
+            
+            again = client.get(path, headers={"If-None-Match": etags[path]})
+            assert again.status_code == 304
+            assert again.content == b""
+            assert again.headers["etag"] == etags[path]
+        
+        # A new audit entry changes the body and so the tag
+        client.post("/tool/echo", json={"params": {"message": "again"}, "signals": {"reward": 0.5}})
+        resp = client.get("/audit", headers={"If-None-Match": etags["/audit"]})
+        assert resp.status_code == 200
+        assert len(resp.json()) == 2
+    
     def test_prometheus_registry_records_steps(self):
         """PrometheusRegistry should track step counts."""
         registry = PrometheusRegistry()
@@ -337,6 +645,97 @@ class TestMetricsEndpoint:
         
         assert registry.steps_total.get() == 5
     
+    def test_prometheus_record_batch_matches_per_step(self):
+        """Batched recording should equal recording each step in order."""
+        kernel = GovernanceKernel(CONSERVATIVE)
+        results = [kernel.step(reward=0.0, novelty=0.0, urgency=0.3) for _ in range(30)]
+        
+        per_step = PrometheusRegistry()
+        for result in results:
+            per_step.record_step(result)
+        
+        batched = PrometheusRegistry()
+        for i in range(0, len(results), 7):
+            batched.record_batch(results[i:i + 7])
+        
+        assert batched.to_prometheus_text() == per_step.to_prometheus_text()
+    
+    def test_prometheus_bytes_match_text(self):
+        """Byte and text exports should carry identical content."""
+        registry = PrometheusRegistry()
+        registry.halts_by_reason.inc(labels={"reason": "exhaustion"})
+        registry.steps_total.inc()
+        
+        data = registry.to_prometheus_bytes()
+        
+        assert isinstance(data, bytes)
+        assert data.decode("utf-8") == registry.to_prometheus_text()
+        assert b'halts_by_reason{reason="exhaustion"} 1.0' in data
+    
+    def test_counter_series_are_exported_in_label_order(self):
+        """Series should be listed sorted by labels, not by first increment."""
+        from governance.metrics import Counter
+        counter = Counter("requests_total", "Requests", labels=["code"])
+        for code in ("500", "200", "404", "200"):
+            counter.inc(labels={"code": code})
+        
+        assert counter.to_prometheus().splitlines()[2:] == [
+            'requests_total{code="200"} 2.0',
+            'requests_total{code="404"} 1.0',
+            'requests_total{code="500"} 1.0',
+        ]
+
+    def test_counter_exports_numpy_scalars_as_plain_numbers(self):
+        """NumPy increments should export as 2.5, not np.float64(2.5)."""
+        import numpy as np
+        from governance.metrics import Counter
+        counter = Counter("x_total", "X")
+        counter.inc(np.float64(2.5))
+        labeled = Counter("y_total", "Y", labels=["kind"])
+        labeled.inc(np.float64(2.5), labels={"kind": "a"})
+
+        assert counter.to_prometheus().splitlines()[-1] == "x_total 2.5"
+        assert labeled.to_prometheus().splitlines()[-1] == 'y_total{kind="a"} 2.5'
+
+    def test_registered_halt_reasons_are_not_exported_until_seen(self):
+        """Preregistered halt reasons should not add zero-valued series."""
+        registry = PrometheusRegistry()
+        text = registry.halts_by_reason.to_prometheus()
+        assert text.splitlines()[-1] == "halts_by_reason 0.0"
+        
+        registry.halts_by_reason.inc_key(registry._halt_key("stagnation"))
+        registry.halts_by_reason.inc(labels={"reason": "stagnation"})
+        
+        assert registry.halts_by_reason.to_prometheus().splitlines()[2:] == [
+            'halts_by_reason{reason="stagnation"} 2.0'
+        ]
+    
+    def test_oversized_scrape_buffer_is_released(self):
+        """A scrape past the soft limit should not keep its buffer alive."""
+        registry = PrometheusRegistry()
+        for i in range(5000):
+            registry.halts_by_reason.inc(labels={"reason": f"reason_{i:05d}"})
+        
+        text = registry.to_prometheus_text()
+        
+        assert len(text) > 128 * 1024
+        assert len(registry._scratch) == 0
+        assert registry.to_prometheus_bytes().decode("utf-8") == text
+    
+    def test_counter_labels_are_order_independent(self):
+        """Label sets should key the same series regardless of dict order."""
+        from governance.metrics import Counter
+        counter = Counter("requests_total", "Requests", labels=["method", "code"])
+        counter.inc(labels={"method": "get", "code": "200"})
+        counter.inc(labels={"code": "200", "method": "get"})
+        
+        assert counter.get(labels={"method": "get", "code": "200"}) == 2.0
+        # Reading an unseen label set must not create a series
+        assert counter.get(labels={"method": "post", "code": "500"}) == 0.0
+        assert counter.to_prometheus().splitlines()[-1] == (
+            'requests_total{code="200",method="get"} 2.0'
+        )
+    
     def test_prometheus_registry_records_halts(self):
         """PrometheusRegistry should track halts by reason."""
         registry = PrometheusRegistry()
@@ -526,6 +925,29 @@ class TestIntegrationSmoke:
         assert result is not None
         assert not result.halted
 
+    
+    def test_policy_loader_reloads_changed_file(self, tmp_path):
+        """Repeated loads are cached until the policy file changes."""
+        pytest.importorskip("yaml")
+        from governance.policy_loader import PolicyLoader, _load_cached
+        
+        config_path = tmp_path / "policies.yaml"
+        config_path.write_text("limits:\n  max_risk: 0.5\n")
+        
+        first = PolicyLoader(str(config_path)).load()
+        hits = _load_cached.cache_info().hits
+        second = PolicyLoader(str(config_path)).load()
+        
+        assert _load_cached.cache_info().hits == hits + 1
+        assert first == second and first is not second
+        assert first.max_steps == 100
+        
+        config_path.write_text("limits:\n  max_risk: 0.25\n  max_steps: 7\n")
+        profile = PolicyLoader(str(config_path)).create_profile()
+        
+        assert profile.max_risk == 0.25
+        assert profile.max_steps == 7
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -36,3 +36,23 @@ def test_governance_control_loss_suppression():
     budget = gov.compute(state)
     
     assert budget.exploration == 0.0
+
+def test_governance_matches_matrix_reference():
+    from governance.profiles import BALANCED
+    gov = GovernanceEngine(BALANCED)
+    rng = np.random.default_rng(0)
+
+    for _ in range(200):
+        s = rng.uniform(-2.0, 2.0, size=5)
+        state = ControlState(*s)
+        budget = gov.compute(state, stagnating=True, dt=0.5)
+
+        g = GovernanceEngine.W.T @ s - GovernanceEngine.V.T @ s
+        g[0] *= BALANCED.stagnation_effort_scale * BALANCED.effort_scale
+        g[1] *= BALANCED.risk_scale
+        g[2] = g[2] * BALANCED.exploration_scale - (BALANCED.exploration_decay + 0.5 * BALANCED.time_exploration_decay)
+        g[3] = g[3] * BALANCED.stagnation_persistence_scale * BALANCED.persistence_scale - (BALANCED.persistence_decay + 0.5 * BALANCED.time_persistence_decay)
+        expected = np.clip(g, 0.0, 1.0)
+
+        actual = [budget.effort, budget.risk, budget.exploration, budget.persistence]
+        assert np.allclose(actual, expected, atol=1e-12)
@@ -5,6 +5,7 @@ Tests for the governance metrics module.
 import sys
 import os
 import json
+import dataclasses
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
 
@@ -69,6 +70,9 @@ class TestGovernanceMetrics:
         assert d["step"] == 1
         assert d["effort"] == 0.5
         assert d["mode"] == "NOMINAL"
+        # The hand-written dict must track every dataclass field
+        assert list(d) == [f.name for f in dataclasses.fields(metrics)]
+        assert d == dataclasses.asdict(metrics)
     
     def test_to_json(self):
         """to_json should produce valid JSON."""
@@ -97,6 +101,34 @@ class TestGovernanceMetrics:
         parsed = json.loads(json_str)
         assert parsed["step"] == 1
 
+    def test_to_json_keeps_non_finite_values(self):
+        """NaN/Infinity are written as the stdlib does, with or without orjson."""
+        metrics = GovernanceMetrics(
+            timestamp="2026-01-30T12:00:00Z",
+            step=1,
+            effort=0.5,
+            risk=0.3,
+            exploration=0.2,
+            persistence=0.4,
+            control_margin=0.5,
+            control_loss=0.1,
+            exploration_pressure=0.2,
+            urgency_level=0.3,
+            state_risk=0.1,
+            reward=float("nan"),
+            novelty=float("inf"),
+            urgency=0.3,
+            difficulty=0.1,
+            trust=1.0,
+            mode="NOMINAL",
+            halted=False,
+        )
+
+        expected = json.dumps(metrics.to_dict(), separators=(',', ':'))
+        assert metrics.to_json() == expected
+        assert metrics.to_json_bytes() == expected.encode("utf-8")
+        assert '"reward":NaN' in expected and '"novelty":Infinity' in expected
+
 
 class TestMetricsCollector:
     """Tests for MetricsCollector."""
@@ -130,6 +162,25 @@ class TestMetricsCollector:
         assert collector.history[0].step == 1
         assert collector.history[4].step == 5
     
+    def test_history_is_bounded(self):
+        """History should keep only the most recent max_history snapshots."""
+        agent = GovernanceAgent(PROFILES[ProfileType.BALANCED])
+        collector = MetricsCollector(max_history=3)
+        
+        for i in range(5):
+            signals = Signals(reward=0.3, novelty=0.1, urgency=0.2)
+            result = step(agent, signals)
+            collector.record(result, signals)
+        
+        assert [m.step for m in collector.history] == [3, 4, 5]
+        assert collector.summary()["total_steps"] == 5
+
+    def test_history_window_must_be_positive(self):
+        """A zero or negative max_history is rejected up front."""
+        for max_history in (0, -1):
+            with pytest.raises(ValueError):
+                MetricsCollector(max_history=max_history)
+
     def test_hooks_are_called(self):
         """Hooks should be invoked on each record."""
         agent = GovernanceAgent(PROFILES[ProfileType.BALANCED])
@@ -180,6 +231,19 @@ class TestMetricsCollector:
             assert "step" in parsed
             assert "effort" in parsed
     
+    def test_jsonl_file_export_matches_string(self, tmp_path):
+        """Streaming to a file should write the same content as the string export."""
+        agent = GovernanceAgent(PROFILES[ProfileType.BALANCED])
+        collector = MetricsCollector()
+        
+        for i in range(3):
+            signals = Signals(reward=0.3, novelty=0.1, urgency=0.2)
+            collector.record(step(agent, signals), signals)
+        
+        path = tmp_path / "metrics.jsonl"
+        assert collector.to_jsonl(str(path)) is None
+        assert path.read_text(encoding="utf-8") == collector.to_jsonl()
+    
     def test_summary(self):
         """summary() should provide aggregate statistics."""
         agent = GovernanceAgent(PROFILES[ProfileType.BALANCED])
@@ -198,6 +262,26 @@ class TestMetricsCollector:
         assert "max" in summary["effort"]
         assert "avg" in summary["effort"]
     
+    def test_summary_matches_history_window(self):
+        """summary() aggregates exactly the retained history window."""
+        agent = GovernanceAgent(PROFILES[ProfileType.BALANCED])
+        collector = MetricsCollector(max_history=4)
+        
+        for i in range(11):
+            signals = Signals(reward=0.1 * (i % 5), novelty=0.1, urgency=0.2)
+            result = step(agent, signals)
+            collector.record(result, signals)
+        
+        efforts = [m.effort for m in collector.history]
+        risks = [m.risk for m in collector.history]
+        summary = collector.summary()
+        
+        assert summary["effort"]["min"] == min(efforts)
+        assert summary["effort"]["max"] == max(efforts)
+        assert summary["effort"]["avg"] == pytest.approx(sum(efforts) / len(efforts))
+        assert summary["risk"]["max"] == max(risks)
+        assert summary["effort"]["final"] == efforts[-1]
+    
     def test_clear(self):
         """clear() should reset history."""
         agent = GovernanceAgent(PROFILES[ProfileType.BALANCED])
@@ -11,6 +11,7 @@ The governance kernel must function identically when:
 - No Grafana dashboard exists
 """
 
+import json
 import os
 import sys
 import tempfile
@@ -190,6 +191,60 @@ def test_local_metrics_sink_disabled():
     os.unlink(path)
 
 
+def test_local_metrics_sink_buffers_until_flush():
+    """Batched sink keeps records in memory until flushed or closed."""
+    with tempfile.NamedTemporaryFile(suffix='.jsonl', delete=False) as f:
+        path = f.name
+    
+    sink = LocalMetricsSink(path, flush_every=10)
+    for i in range(3):
+        assert sink.record(step=i, effort_remaining=0.5, risk_level=0.1) is True
+    
+    with open(path, 'r') as f:
+        assert f.read() == "", "Records should still be buffered"
+    
+    assert sink.close() is True
+    with open(path, 'r') as f:
+        lines = f.read().splitlines()
+    assert [json.loads(line)["step"] for line in lines] == [0, 1, 2]
+    
+    # Cleanup
+    os.unlink(path)
+
+
+def test_local_metrics_sink_flush_interval():
+    """An elapsed flush_interval flushes even below flush_every."""
+    with tempfile.NamedTemporaryFile(suffix='.jsonl', delete=False) as f:
+        path = f.name
+    
+    sink = LocalMetricsSink(path, flush_every=1000, flush_interval=0.0)
+    assert sink.record(step=1, effort_remaining=0.5, risk_level=0.1) is True
+    
+    with open(path, 'r') as f:
+        assert len(f.read().splitlines()) == 1
+    
+    sink.close()
+    os.unlink(path)
+
+
+def test_local_metrics_sink_keeps_non_finite_values():
+    """NaN extra fields are written as the stdlib does, with or without orjson."""
+    with tempfile.NamedTemporaryFile(suffix='.jsonl', delete=False) as f:
+        path = f.name
+
+    sink = LocalMetricsSink(path)
+    extra = {"score": float("nan"), "nested": {"bound": float("inf")}}
+    assert sink.record(step=1, effort_remaining=0.5, risk_level=0.1, extra=extra) is True
+    sink.close()
+
+    with open(path, 'r') as f:
+        line = f.read().strip()
+    assert '"score":NaN' in line
+    assert '"bound":Infinity' in line
+
+    os.unlink(path)
+
+
 def test_governance_determinism_independent_of_observability():
     """Test that governance is deterministic regardless of observability state."""
     # Run the same scenario 3 times with different observability setups
@@ -0,0 +1,106 @@
+"""
+Tests for the offline audit replay tool (scripts/replay_audit.py).
+"""
+
+import hashlib
+
+import pytest
+
+from governance.audit import HashChainedAuditLogger
+from scripts import replay_audit
+
+
+def _forged_line(body: str) -> str:
+    """A line whose entry_hash is the SHA256 of its own (non-canonical) body."""
+    entry_hash = hashlib.sha256(body.encode("utf-8")).hexdigest()
+    return f'{body[:-1]},"entry_hash":"{entry_hash}"}}\n'
+
+
+@pytest.mark.parametrize("body", [
+    '{"previous_hash":"","decision":"ALLOW","decision":"HALT","step":1}',
+    '{"step":1,"previous_hash":"","decision":"HALT"}',
+], ids=["duplicate-key", "unsorted-keys"])
+def test_non_canonical_lines_are_rejected(tmp_path, body):
+    """Only the canonical JSON of the parsed entry verifies, as in the library."""
+    path = tmp_path / "audit.jsonl"
+    path.write_text(_forged_line(body))
+
+    entries, error = replay_audit.load_audit_file(str(path))
+    assert error is None
+
+    is_valid, message = replay_audit.verify_chain(entries)
+    assert not is_valid
+    assert "Hash mismatch at entry 1" in message
+    assert not HashChainedAuditLogger.verify_chain(str(path))[0]
+
+
+def _append_chain(path, count: int) -> None:
+    """Append count valid entries to the chain file at path."""
+    entries, _ = replay_audit.load_audit_file(str(path)) if path.exists() else ([], None)
+    prev_hash = entries[-1]["entry_hash"] if entries else ""
+    step = len(entries)
+    with open(path, "a", encoding="utf-8") as f:
+        for _ in range(count):
+            step += 1
+            entry = {"step": step, "decision": "ALLOW", "previous_hash": prev_hash}
+            entry["entry_hash"] = prev_hash = replay_audit.compute_entry_hash(entry)
+            f.write(replay_audit.canonical_json(entry) + "\n")
+
+
+def _run(*argv):
+    """Run the CLI and return its exit code."""
+    with pytest.raises(SystemExit) as exc:
+        replay_audit.main(list(argv))
+    return exc.value.code
+
+
+@pytest.fixture
+def chain(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    _append_chain(path, 3)
+    return path
+
+
+def _sidecar(path):
+    return path.with_name(path.name + ".verified.json")
+
+
+def test_verify_resumes_after_appended_tail(chain, capsys):
+    """A second --verify only checks entries appended since the first."""
+    assert _run("--verify", str(chain)) == 0
+    assert _sidecar(chain).exists()
+
+    _append_chain(chain, 2)
+    capsys.readouterr()
+    assert _run("--verify", str(chain)) == 0
+    assert "5 entries, integrity OK (3 previously verified)" in capsys.readouterr().out
+
+
+def test_verify_rechecks_everything_when_prefix_changes(chain, capsys):
+    """Editing already-verified bytes invalidates the sidecar."""
+    assert _run("--verify", str(chain)) == 0
+    chain.write_text(chain.read_text().replace('"step":1', '"step":7', 1))
+    _append_chain(chain, 1)
+
+    capsys.readouterr()
+    assert _run("--verify", str(chain)) == 1
+    assert "Hash mismatch at entry 1" in capsys.readouterr().out
+
+
+def test_verify_full_ignores_and_skips_sidecar(chain, capsys):
+    """--full re-verifies from the start and writes no sidecar."""
+    assert _run("--verify", "--full", str(chain)) == 0
+    assert not _sidecar(chain).exists()
+
+    assert _run("--verify", str(chain)) == 0
+    capsys.readouterr()
+    assert _run("--verify", "--no-cache", str(chain)) == 0
+    out = capsys.readouterr().out
+    assert "3 entries, integrity OK" in out
+    assert "previously verified" not in out
+
+
+def test_summary_run_leaves_no_sidecar(chain):
+    """Read-only inspection must not write next to the audit file."""
+    assert _run("--summary", str(chain)) == 0
+    assert not _sidecar(chain).exists()